@@ -0,0 +1,21 @@
+from injector import Injector
+
+from app.repositories.caches import ConfigEntitiesCache
+from app.settings import Settings
+from shared.models import AllowedChat, Building, Message
+from shared.services.events.models import EventItem
+from shared.services.events.service import EventsService
+
+
+def register(_: Settings, injector: Injector):
+    events = injector.get(EventsService)
+    cache = injector.get(ConfigEntitiesCache)
+
+    def invalidate(model):
+        async def handler(_: EventItem):
+            cache.invalidate(model)
+        return handler
+
+    events.subscribe("buildings_updated", invalidate(Building))
+    events.subscribe("messages_updated", invalidate(Message))
+    events.subscribe("chats_updated", invalidate(AllowedChat))
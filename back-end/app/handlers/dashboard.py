@@ -0,0 +1,16 @@
+from injector import Injector
+
+from app.services.dashboard import DashboardSnapshot
+from app.settings import Settings
+from shared.services.events.models import EventItem
+from shared.services.events.service import EventsService
+
+
+def register(_: Settings, injector: Injector):
+    events = injector.get(EventsService)
+
+    async def invalidate_dashboard_snapshot(_: EventItem):
+        injector.get(DashboardSnapshot).invalidate()
+
+    for event_type in ("station_data_updated", "ext_data_updated", "buildings_updated"):
+        events.subscribe(event_type, invalidate_dashboard_snapshot)
@@ -0,0 +1,16 @@
+from injector import Injector
+
+from app.repositories import IExtDataRepository
+from app.settings import Settings
+from shared.services.events.models import EventItem
+from shared.services.events.service import EventsService
+
+
+def register(_: Settings, injector: Injector):
+    events = injector.get(EventsService)
+
+    async def refresh_ext_data_cache(_: EventItem):
+        ext_data = injector.get(IExtDataRepository)
+        await ext_data.refresh_cache()
+
+    events.subscribe("ext_data_updated", refresh_ext_data_cache)
@@ -0,0 +1,15 @@
+from injector import Injector
+
+from app.services import PeriodicSendTrigger
+from app.settings import Settings
+from shared.services.events.models import EventItem
+from shared.services.events.service import EventsService
+
+
+def register(_: Settings, injector: Injector):
+    events = injector.get(EventsService)
+
+    async def evaluate_messages(_: EventItem):
+        injector.get(PeriodicSendTrigger).request()
+
+    events.subscribe("station_data_updated", evaluate_messages)
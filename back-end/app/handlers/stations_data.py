@@ -0,0 +1,16 @@
+from injector import Injector
+
+from app.repositories import IStationsDataRepository
+from app.settings import Settings
+from shared.services.events.models import EventItem
+from shared.services.events.service import EventsService
+
+
+def register(_: Settings, injector: Injector):
+    events = injector.get(EventsService)
+
+    async def refresh_station_data_cache(_: EventItem):
+        stations_data = injector.get(IStationsDataRepository)
+        await stations_data.refresh_cache()
+
+    events.subscribe("station_data_updated", refresh_station_data_cache)
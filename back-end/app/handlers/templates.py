@@ -0,0 +1,15 @@
+from injector import Injector
+
+from app.settings import Settings
+from app.utils import template_cache
+from shared.services.events.models import EventItem
+from shared.services.events.service import EventsService
+
+
+def register(_: Settings, injector: Injector):
+    events = injector.get(EventsService)
+
+    async def clear_template_cache(_: EventItem):
+        template_cache.clear()
+
+    events.subscribe("messages_updated", clear_template_cache)
@@ -2,18 +2,25 @@ from injector import Injector
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from app.settings import Settings
-from app.services import MessageProcessorService
+from app.services import MessageProcessorService, PeriodicSendTrigger
 
-def register(_: Settings, injector: Injector):
+
+def register(settings: Settings, injector: Injector):
+    scheduler = injector.get(AsyncIOScheduler)
+    trigger = injector.get(PeriodicSendTrigger)
+    scheduler.add_listener(trigger.handle_job_event, PeriodicSendTrigger.JOB_EVENTS)
 
     async def periodic_send_message():
         message_processor: MessageProcessorService = injector.get(MessageProcessorService)
-        await message_processor.periodic_send()
+        summary = await message_processor.periodic_send()
+        if summary.next_send_time is not None:
+            trigger.request(summary.next_send_time)
 
-    scheduler = injector.get(AsyncIOScheduler)
     scheduler.add_job(
-        id      = 'periodic_send_message',
-        func    = periodic_send_message,
-        trigger = 'interval',
-        seconds = 60,
+        id            = PeriodicSendTrigger.JOB_ID,
+        func          = periodic_send_message,
+        trigger       = 'interval',
+        seconds       = settings.MESSAGES_SEND_INTERVAL,
+        max_instances = 1,
+        coalesce      = True,
     )
@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta, timezone
+from injector import Injector
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.services import MaintenanceService
+from app.settings import Settings
+
+
+def register(settings: Settings, injector: Injector):
+    scheduler = injector.get(AsyncIOScheduler)
+    backfilled = False
+
+    async def update_station_data_rollups():
+        nonlocal backfilled
+        # the first run after startup covers everything raw data still holds
+        lookback = (
+            timedelta(hours=settings.STATISTIC_ROLLUP_LOOKBACK_HOURS) if backfilled
+            else timedelta(days=settings.STATISTIC_KEEP_DAYS)
+        )
+        service = injector.get(MaintenanceService)
+        await service.update_rollups(datetime.now(timezone.utc) - lookback)
+        backfilled = True
+
+    scheduler.add_job(
+        id            = 'update_station_data_rollups',
+        func          = update_station_data_rollups,
+        trigger       = 'cron',
+        minute        = '5',
+        second        = '0',
+        next_run_time = datetime.now(),
+        max_instances = 1,
+    )
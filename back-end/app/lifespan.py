@@ -7,9 +7,11 @@ from contextlib import asynccontextmanager
 
 from app.app_container import bind_client_session, init_container
 from app.settings import Settings
+from app.handlers import register_handlers
 from app.jobs import register_jobs
+from app.repositories import IStationsDataRepository
 from app.routes import register_routes
-from app.services import AuthorizationService, BeanieInitializer, BotsService, TelegramService, DeyeApiService
+from app.services import AuthorizationService, AvailabilityService, BeanieInitializer, BotsService, TelegramService, DeyeApiService
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from shared.services.events.service import EventsService
@@ -44,12 +46,19 @@ async def lifespan(app: FastAPI):
     beanie_initializer = injector.get(BeanieInitializer)
     await beanie_initializer.init()
 
+    stations_data = injector.get(IStationsDataRepository)
+    await stations_data.init_cache()
+
+    availability = injector.get(AvailabilityService)
+    await availability.init()
+
     deye_service = injector.get(DeyeApiService)
     await deye_service.init()
 
     telegram_service = injector.get(TelegramService)
 
     events: EventsService = injector.get(EventsService)
+    register_handlers(settings, injector)
     await events.start()
 
     scheduler = injector.get(AsyncIOScheduler)
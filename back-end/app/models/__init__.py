@@ -1,4 +1,8 @@
 from .assumed_station_status import AssumedStationStatus
+from .availability_strategy_type import AvailabilityStrategyType
+from .charge_durations import ChargeDurations
+from .downsampling_mode import DownsamplingMode
+from .export_format import ExportFormat
 from .station_statistic_data import StationStatisticData
 from .deye import DeyeConnectionStatus, DeyeStationData, DeyeStation, DeyeStationList
 from .sorting_config import SortingConfig
@@ -10,6 +14,10 @@ from .date_range_value import DateRangeValue
 
 __all__ = [
     AssumedStationStatus,
+    AvailabilityStrategyType,
+    ChargeDurations,
+    DownsamplingMode,
+    ExportFormat,
     StationStatisticData,
     DeyeConnectionStatus,
     DeyeStation,
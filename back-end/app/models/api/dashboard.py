@@ -1,11 +1,18 @@
+from datetime import date, datetime, timezone
 from enum import Enum
 from typing import Optional, List
 from beanie import PydanticObjectId
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from shared.models.localizable_value import LocalizableValue
 
 
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
 class SaveDashboardConfigRequest(BaseModel):
     title: LocalizableValue
     enable_outages_schedule: bool = Field(False, alias="enableOutagesSchedule")
@@ -60,6 +67,10 @@ class PowerLogsRequest(BaseModel):
     )
 
 
+class BuildingsPowerLogsRequest(PowerLogsRequest):
+    building_ids: List[PydanticObjectId] = Field(alias="buildingIds")
+
+
 class BuildingsSummaryRequest(BaseModel):
     building_ids: List[PydanticObjectId] = Field(alias="buildingIds")
 
@@ -117,6 +128,8 @@ class PowerLogsResponse(BaseModel):
     total_available_seconds: int = Field(alias="totalAvailableSeconds")
     total_unavailable_seconds: int = Field(alias="totalUnavailableSeconds")
     total_generator_seconds: Optional[int] = Field(None, alias="totalGeneratorSeconds")
+    total_grid_charging_seconds: Optional[int] = Field(None, alias="totalGridChargingSeconds")
+    total_recuperation_seconds: Optional[int] = Field(None, alias="totalRecuperationSeconds")
     total_seconds: int = Field(alias="totalSeconds")
 
     model_config = ConfigDict(
@@ -125,6 +138,59 @@ class PowerLogsResponse(BaseModel):
     )
 
 
+class BuildingPowerLogsResponse(PowerLogsResponse):
+    id: PydanticObjectId
+
+
+class OutagesReportRequest(BaseModel):
+    building_ids: Optional[List[PydanticObjectId]] = Field(None, alias="buildingIds")
+    start_date: datetime = Field(alias="startDate")
+    end_date: datetime = Field(alias="endDate")
+
+    @model_validator(mode="after")
+    def validate_time_range(self):
+        # naive dates are UTC; comparing them with aware ones would raise TypeError
+        self.start_date = _as_utc(self.start_date)
+        self.end_date = _as_utc(self.end_date)
+        if self.start_date >= self.end_date:
+            raise ValueError("startDate must be earlier than endDate")
+        return self
+
+    model_config = ConfigDict(
+        populate_by_name = True,
+        from_attributes  = True,
+    )
+
+
+class OutagesStatisticsResponse(BaseModel):
+    outages_count: int = Field(alias="outagesCount")
+    outage_minutes: float = Field(alias="outageMinutes")
+    available_minutes: float = Field(alias="availableMinutes")
+    longest_outage_minutes: float = Field(alias="longestOutageMinutes")
+    mean_time_between_outages_minutes: Optional[float] = Field(None, alias="meanTimeBetweenOutagesMinutes")
+
+    model_config = ConfigDict(
+        populate_by_name = True,
+        from_attributes  = True,
+    )
+
+
+class DailyOutagesStatisticsResponse(OutagesStatisticsResponse):
+    day: date
+
+
+class BuildingOutagesReportResponse(BaseModel):
+    id: PydanticObjectId
+    name: LocalizableValue
+    total: OutagesStatisticsResponse
+    days: List[DailyOutagesStatisticsResponse]
+
+    model_config = ConfigDict(
+        populate_by_name = True,
+        from_attributes  = True,
+    )
+
+
 __all__ = [
     "BuildingResponse",
     "ChargeSource",
@@ -134,8 +200,14 @@ __all__ = [
     "DashboardConfigResponse",
     "EditBuildingResponse",
     "PowerLogsRequest",
+    "BuildingsPowerLogsRequest",
     "PeriodResponse",
     "PowerLogsResponse",
+    "BuildingPowerLogsResponse",
+    "OutagesReportRequest",
+    "OutagesStatisticsResponse",
+    "DailyOutagesStatisticsResponse",
+    "BuildingOutagesReportResponse",
     "SaveBuildingRequest",
     "SaveDashboardConfigRequest",
 ]
\ No newline at end of file
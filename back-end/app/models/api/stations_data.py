@@ -1,40 +1,66 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
+from beanie import PydanticObjectId
 from pydantic import BaseModel, Field, model_validator
 
+from ..downsampling_mode import DownsamplingMode
+from ..export_format import ExportFormat
+
+
+def _validate_time_range(request):
+    has_last_seconds = request.last_seconds is not None
+    has_range = request.start_date is not None or request.end_date is not None
+
+    if has_last_seconds and has_range:
+        raise ValueError(
+            "Provide either lastSeconds OR startDate + endDate, not both"
+        )
+
+    if has_range:
+        if request.start_date is None or request.end_date is None:
+            raise ValueError(
+                "Both startDate and endDate must be provided together"
+            )
+
+        if request.start_date >= request.end_date:
+            raise ValueError(
+                "startDate must be earlier than endDate"
+            )
+
+    if not has_last_seconds and not has_range:
+        raise ValueError(
+            "You must provide either lastSeconds OR startDate + endDate"
+        )
+
 
 class StationsDataRequest(BaseModel):
     last_seconds: Optional[int] = Field(None, alias="lastSeconds")
     start_date: Optional[datetime] = Field(None, alias="startDate")
     end_date: Optional[datetime] = Field(None, alias="endDate")
     records_count: Optional[int] = Field(250, alias="recordsCount")
+    mode: DownsamplingMode = Field(DownsamplingMode.AVERAGE)
 
     @model_validator(mode="after")
     def validate_time_range(self):
-        has_last_seconds = self.last_seconds is not None
-        has_range = self.start_date is not None or self.end_date is not None
-
-        if has_last_seconds and has_range:
-            raise ValueError(
-                "Provide either lastSeconds OR startDate + endDate, not both"
-            )
+        _validate_time_range(self)
+        return self
 
-        if has_range:
-            if self.start_date is None or self.end_date is None:
-                raise ValueError(
-                    "Both startDate and endDate must be provided together"
-                )
+    model_config = {
+        "populate_by_name": True,
+        "from_attributes": True,
+    }
 
-            if self.start_date >= self.end_date:
-                raise ValueError(
-                    "startDate must be earlier than endDate"
-                )
 
-        if not has_last_seconds and not has_range:
-            raise ValueError(
-                "You must provide either lastSeconds OR startDate + endDate"
-            )
+class StationsDataExportRequest(BaseModel):
+    station_ids: Optional[List[PydanticObjectId]] = Field(None, alias="stationIds")
+    last_seconds: Optional[int] = Field(None, alias="lastSeconds")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+    format: ExportFormat = Field(ExportFormat.NDJSON)
 
+    @model_validator(mode="after")
+    def validate_time_range(self):
+        _validate_time_range(self)
         return self
 
     model_config = {
@@ -43,6 +69,20 @@ class StationsDataRequest(BaseModel):
     }
 
 
+class StationDataRollupsRequest(BaseModel):
+    station_ids: Optional[List[PydanticObjectId]] = Field(None, alias="stationIds")
+    period: Literal["hour", "day"] = Field("day")
+    start_date: datetime = Field(alias="startDate")
+    end_date: datetime = Field(alias="endDate")
+
+    model_config = {
+        "populate_by_name": True,
+        "from_attributes": True,
+    }
+
+
 __all__ = [
     "StationsDataRequest",
+    "StationsDataExportRequest",
+    "StationDataRollupsRequest",
 ]
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class AvailabilityStrategyType(str, Enum):
+    ANY = "any"
+    ALL = "all"
+    MAJORITY = "majority"
+    QUORUM = "quorum"
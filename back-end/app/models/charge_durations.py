@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ChargeDurations:
+    generator_seconds: float = 0.0
+    grid_seconds: float = 0.0
+    recuperation_seconds: float = 0.0
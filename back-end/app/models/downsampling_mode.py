@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class DownsamplingMode(str, Enum):
+    AVERAGE = "average"
+    LTTB = "lttb"
@@ -10,6 +10,8 @@ from .interfaces import (
     DataQuery,
     IExtDataRepository,
     IDashboardRepository,
+    IStationDataRollupsRepository,
+    IAvailabilityRepository,
 )
 from .container import RepositoryContainer
 
@@ -17,4 +19,5 @@ from .container import RepositoryContainer
 __all__ = [IMessagesRepository, IBotsRepository, IStationsRepository, 
            IStationsDataRepository, ILookupsRepository, IChatsRepository,
            IUsersRepository, IVisitsCounterRepository, RepositoryContainer,
-           DataQuery, IExtDataRepository, IDashboardRepository]
\ No newline at end of file
+           DataQuery, IExtDataRepository, IDashboardRepository,
+           IStationDataRollupsRepository, IAvailabilityRepository]
\ No newline at end of file
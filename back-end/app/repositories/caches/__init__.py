@@ -0,0 +1,8 @@
+from .config_entities import ConfigEntitiesCache
+from .ext_data import ExtDataCache
+from .station_data import StationDataCache
+from .station_data_aggregates import StationDataAggregates
+from .station_data_store import StationDataStore
+
+
+__all__ = [ConfigEntitiesCache, ExtDataCache, StationDataCache, StationDataAggregates, StationDataStore]
@@ -0,0 +1,64 @@
+from typing import Awaitable, Callable, Dict, List, Type, TypeVar
+
+from beanie import Document
+
+
+TDocument = TypeVar("TDocument", bound=Document)
+
+
+class ConfigEntitiesCache:
+    """Fully linked configuration documents (buildings, messages, allowed chats).
+
+    Entries are dropped on admin changes; linked documents that change in place
+    (e.g. station status refreshed by the sync job) are swapped into cached
+    entities without reloading them.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Type[Document], List[Document]] = {}
+        self._versions: Dict[Type[Document], int] = {}
+
+    def get_version(self, model: Type[Document]) -> int:
+        return self._versions.get(model, 0)
+
+    def get(self, model: Type[TDocument]) -> List[TDocument] | None:
+        return self._entries.get(model)
+
+    def set(self, model: Type[TDocument], version: int, documents: List[TDocument]):
+        if version == self.get_version(model):
+            self._entries[model] = documents
+
+    async def get_or_load(
+        self,
+        model: Type[TDocument],
+        load: Callable[[], Awaitable[List[TDocument]]],
+    ) -> List[TDocument]:
+        documents = self.get(model)
+        if documents is None:
+            version = self.get_version(model)
+            documents = await load()
+            self.set(model, version, documents)
+        return list(documents)
+
+    def find(self, model: Type[TDocument], id) -> TDocument | None:
+        return next((document for document in self._entries.get(model, []) if document.id == id), None)
+
+    def invalidate(self, *models: Type[Document]):
+        for model in models:
+            self._versions[model] = self.get_version(model) + 1
+            self._entries.pop(model, None)
+
+    def refresh_link(self, linked: Document):
+        def matches(value) -> bool:
+            return type(value) is type(linked) and value.id == linked.id
+
+        for documents in self._entries.values():
+            for document in documents:
+                for name in type(document).model_fields:
+                    value = getattr(document, name, None)
+                    if isinstance(value, list):
+                        for i, item in enumerate(value):
+                            if matches(item):
+                                value[i] = linked
+                    elif matches(value):
+                        setattr(document, name, linked)
@@ -0,0 +1,34 @@
+from typing import Dict, List
+
+from beanie import PydanticObjectId
+
+from shared.models.ext_data import ExtData
+from .utils import as_utc
+
+
+class ExtDataCache:
+    def __init__(self):
+        self._latest: Dict[PydanticObjectId, ExtData] = {}
+
+    @property
+    def user_ids(self) -> List[PydanticObjectId]:
+        return list(self._latest)
+
+    def get_latest(self, user_id: PydanticObjectId) -> ExtData | None:
+        return self._latest.get(user_id)
+
+    def add(self, ext_data: ExtData) -> bool:
+        current = self._latest.get(ext_data.user_id)
+        if current is not None and as_utc(current.received_at) > as_utc(ext_data.received_at):
+            return False
+        self._latest[ext_data.user_id] = ext_data
+        return True
+
+    def set(self, ext_data: ExtData):
+        self._latest[ext_data.user_id] = ext_data
+
+    def remove(self, user_id: PydanticObjectId):
+        self._latest.pop(user_id, None)
+
+    def clear(self):
+        self._latest = {}
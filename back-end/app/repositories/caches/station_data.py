@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Dict, List, Set
+
+from beanie import PydanticObjectId
+
+from shared.models import StationData
+from .utils import as_utc
+
+
+class StationDataCache:
+    LATEST_SAMPLES_COUNT = 2
+
+    def __init__(self):
+        self._samples: Dict[PydanticObjectId, List[StationData]] = {}
+        self._station_ids: Dict[int, PydanticObjectId] = {}
+        self._complete: Set[PydanticObjectId] = set()
+
+    def get_last_update_time(self, station_id: PydanticObjectId) -> datetime | None:
+        samples = self._samples.get(station_id)
+        return as_utc(samples[0].last_update_time) if samples else None
+
+    def is_new(self, station_id: PydanticObjectId, last_update_time: datetime) -> bool:
+        current = self.get_last_update_time(station_id)
+        return current is None or as_utc(last_update_time) > current
+
+    def add(self, station_data: StationData) -> bool:
+        if station_data.last_update_time is None:
+            return False
+        if not self.is_new(station_data.station_id, station_data.last_update_time):
+            return False
+
+        samples = self._samples.get(station_data.station_id, [])
+        self._samples[station_data.station_id] = (
+            [station_data] + samples
+        )[:self.LATEST_SAMPLES_COUNT]
+        return True
+
+    def get_latest(self, station_id: PydanticObjectId) -> StationData | None:
+        samples = self._samples.get(station_id)
+        return samples[0] if samples else None
+
+    def get_latest_samples(self, station_id: PydanticObjectId) -> List[StationData]:
+        return list(self._samples.get(station_id, []))
+
+    def is_complete(self, station_id: PydanticObjectId) -> bool:
+        """True once the database confirmed there are no samples older than the cached ones."""
+        return station_id in self._complete
+
+    def set_complete(self, station_id: PydanticObjectId):
+        self._complete.add(station_id)
+
+    def get_station_object_id(self, station_id: int) -> PydanticObjectId | None:
+        return self._station_ids.get(station_id)
+
+    def set_station_object_id(self, station_id: int, id: PydanticObjectId):
+        self._station_ids[station_id] = id
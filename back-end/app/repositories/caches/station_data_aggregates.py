@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from beanie import PydanticObjectId
+from injector import inject
+
+from app.settings import Settings
+from shared.models import StationData
+from .utils import as_utc, get_numeric_columns
+
+
+def _to_minute(value: datetime) -> int:
+    return int(as_utc(value).timestamp()) // 60
+
+
+class _MinuteBucket:
+    __slots__ = ("count", "sums")
+
+    def __init__(self, columns_count: int):
+        self.count = 0
+        self.sums = [0.0] * columns_count
+
+
+@inject
+class StationDataAggregates:
+    def __init__(self, settings: Settings):
+        self._retention = timedelta(hours=settings.STATISTIC_AGGREGATES_HOURS)
+        self._columns = get_numeric_columns()
+        self._column_indexes = {column: i for i, column in enumerate(self._columns)}
+        self._buckets: Dict[PydanticObjectId, Dict[int, _MinuteBucket]] = {}
+        self._last_update_times: Dict[PydanticObjectId, datetime] = {}
+        self._covered_since: datetime | None = None
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    @property
+    def enabled(self) -> bool:
+        return self._retention.total_seconds() > 0
+
+    def get_bootstrap_start(self) -> datetime:
+        return datetime.now(timezone.utc) - self._retention
+
+    def _get_station_buckets(self, station_id: PydanticObjectId) -> Dict[int, _MinuteBucket]:
+        buckets = self._buckets.get(station_id)
+        if buckets is None:
+            buckets = self._buckets[station_id] = {}
+        return buckets
+
+    def _prune(self, buckets: Dict[int, _MinuteBucket]):
+        oldest_minute = _to_minute(self.get_bootstrap_start())
+        while buckets:
+            minute = next(iter(buckets))
+            if minute >= oldest_minute:
+                break
+            del buckets[minute]
+
+    def init(self, start: datetime, buckets: List[dict]):
+        self._buckets = {}
+        self._last_update_times = {}
+        for item in sorted(buckets, key=lambda b: b["minute"]):
+            station_id = item["station_id"]
+            bucket = _MinuteBucket(len(self._columns))
+            bucket.count = item["count"]
+            bucket.sums = [float(item.get(column) or 0) for column in self._columns]
+            self._get_station_buckets(station_id)[_to_minute(item["minute"])] = bucket
+
+            last_update_time = as_utc(item["last_update_time"])
+            if station_id not in self._last_update_times or last_update_time > self._last_update_times[station_id]:
+                self._last_update_times[station_id] = last_update_time
+        self._covered_since = as_utc(start)
+
+    def add(self, station_data: StationData):
+        if self._covered_since is None or station_data.last_update_time is None:
+            return
+
+        last_update_time = as_utc(station_data.last_update_time)
+        last_aggregated = self._last_update_times.get(station_data.station_id)
+        if last_aggregated is not None and last_update_time <= last_aggregated:
+            return
+        self._last_update_times[station_data.station_id] = last_update_time
+
+        minute = _to_minute(station_data.last_update_time)
+        station_buckets = self._get_station_buckets(station_data.station_id)
+        bucket = station_buckets.get(minute)
+        if bucket is None:
+            bucket = station_buckets[minute] = _MinuteBucket(len(self._columns))
+
+        bucket.count += 1
+        for i, column in enumerate(self._columns):
+            bucket.sums[i] += getattr(station_data, column) or 0
+        self._prune(station_buckets)
+
+    def get_average(
+        self,
+        station_id: PydanticObjectId,
+        column_name: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> float | None:
+        if start_date is None or self._covered_since is None:
+            return None
+
+        start_date = as_utc(start_date)
+        if start_date < max(self._covered_since, self.get_bootstrap_start()):
+            return None
+
+        column_index = self._column_indexes.get(column_name)
+        if column_index is None:
+            return None
+
+        start_minute = _to_minute(start_date)
+        end_minute = _to_minute(end_date) if end_date is not None else None
+
+        total = 0.0
+        count = 0
+        for minute, bucket in self._buckets.get(station_id, {}).items():
+            if minute < start_minute or (end_minute is not None and minute > end_minute):
+                continue
+            total += bucket.sums[column_index]
+            count += bucket.count
+
+        return total / count if count else 0.0
@@ -0,0 +1,172 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Sequence
+
+from beanie import PydanticObjectId
+from injector import inject
+
+from app.settings import Settings
+from shared.models import StationData
+from .utils import as_utc, get_numeric_columns
+
+
+_NAN = float("nan")
+
+
+def _to_millis(value: datetime) -> int:
+    return int(as_utc(value).timestamp() * 1000)
+
+
+def _from_millis(value: int) -> datetime:
+    return datetime.fromtimestamp(value / 1000, timezone.utc).replace(tzinfo=None)
+
+
+def _from_float(value: float) -> float | None:
+    return None if value != value else value
+
+
+class _StationSeries:
+    __slots__ = ("times", "values")
+
+    def __init__(self, columns: Sequence[str]):
+        self.times = array("q")
+        self.values = {column: array("d") for column in columns}
+
+    def insert(self, time: int, sample: dict) -> bool:
+        index = len(self.times)
+        if index and time <= self.times[-1]:
+            index = bisect_left(self.times, time)
+            if index < len(self.times) and self.times[index] == time:
+                return False
+
+        self.times.insert(index, time)
+        for column, values in self.values.items():
+            value = sample.get(column)
+            values.insert(index, _NAN if value is None else float(value))
+        return True
+
+    def prune(self, oldest: int):
+        if not self.times or self.times[0] >= oldest:
+            return
+        index = bisect_left(self.times, oldest)
+        del self.times[:index]
+        for values in self.values.values():
+            del values[:index]
+
+    def get_slice(self, start: int | None, end: int | None) -> slice:
+        lo = bisect_left(self.times, start) if start is not None else 0
+        hi = bisect_right(self.times, end) if end is not None else len(self.times)
+        return slice(lo, hi)
+
+
+@inject
+class StationDataStore:
+    def __init__(self, settings: Settings):
+        self._retention = timedelta(hours=settings.STATISTIC_STORE_HOURS)
+        self._columns = get_numeric_columns()
+        self._series: Dict[PydanticObjectId, _StationSeries] = {}
+        self._covered_since: datetime | None = None
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    @property
+    def enabled(self) -> bool:
+        return self._retention.total_seconds() > 0
+
+    def get_bootstrap_start(self) -> datetime:
+        return datetime.now(timezone.utc) - self._retention
+
+    def _get_series(self, station_id: PydanticObjectId) -> _StationSeries:
+        series = self._series.get(station_id)
+        if series is None:
+            series = self._series[station_id] = _StationSeries(self._columns)
+        return series
+
+    def _insert(self, station_id: PydanticObjectId, last_update_time: datetime, sample: dict) -> bool:
+        series = self._get_series(station_id)
+        inserted = series.insert(_to_millis(last_update_time), sample)
+        series.prune(_to_millis(self.get_bootstrap_start()))
+        return inserted
+
+    def reset(self):
+        self._series = {}
+        self._covered_since = None
+
+    def load(self, documents: Iterable[dict]):
+        for document in documents:
+            if document.get("last_update_time") is None:
+                continue
+            self._insert(document["station_id"], document["last_update_time"], document)
+
+    def set_covered_since(self, start: datetime):
+        self._covered_since = as_utc(start)
+
+    def add(self, station_data: StationData):
+        if not self.enabled or station_data.last_update_time is None:
+            return
+
+        self._insert(
+            station_data.station_id,
+            station_data.last_update_time,
+            {column: getattr(station_data, column) for column in self._columns},
+        )
+
+    def covers(self, start_date: datetime | None, columns: Iterable[str] = ()) -> bool:
+        if start_date is None or self._covered_since is None:
+            return False
+        if any(column not in self._columns for column in columns):
+            return False
+        return as_utc(start_date) >= max(self._covered_since, self.get_bootstrap_start())
+
+    def get_range(
+        self,
+        station_id: PydanticObjectId,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        columns: Sequence[str],
+    ) -> List[dict]:
+        series = self._series.get(station_id)
+        if series is None:
+            return []
+
+        window = series.get_slice(
+            _to_millis(start_date) if start_date is not None else None,
+            _to_millis(end_date) if end_date is not None else None,
+        )
+        times = series.times[window]
+        values = [(column, series.values[column][window]) for column in columns]
+
+        return [
+            {
+                "last_update_time": _from_millis(time),
+                **{column: _from_float(column_values[i]) for column, column_values in values},
+            }
+            for i, time in enumerate(times)
+        ]
+
+    def get_average(
+        self,
+        station_id: PydanticObjectId,
+        column_name: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> float | None:
+        if not self.covers(start_date, (column_name,)):
+            return None
+
+        series = self._series.get(station_id)
+        if series is None:
+            return 0.0
+
+        window = series.get_slice(
+            _to_millis(start_date),
+            _to_millis(end_date) if end_date is not None else None,
+        )
+        values = series.values[column_name][window]
+        if not values:
+            return 0.0
+
+        return sum(value for value in values if value == value) / len(values)
@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+from typing import List, get_args, get_origin
+
+from shared.models import StationData
+
+
+def as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def get_numeric_columns() -> List[str]:
+    columns = []
+    for name, field_info in StationData.model_fields.items():
+        field_type = field_info.annotation
+        if get_origin(field_type) is not None:
+            field_type = get_args(field_type)[0]
+        if field_type in (int, float):
+            columns.append(name)
+    return columns
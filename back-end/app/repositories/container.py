@@ -1,4 +1,4 @@
-from injector import Binder, Module, noscope
+from injector import Binder, Module, noscope, singleton
 
 from .interfaces import (
     IMessagesRepository,
@@ -11,6 +11,8 @@ from .interfaces import (
     IChatsRepository,
     IExtDataRepository,
     IDashboardRepository,
+    IStationDataRollupsRepository,
+    IAvailabilityRepository,
 )
 from .implementations import (
     MessagesRepository,
@@ -23,12 +25,21 @@ from .implementations import (
     ChatsRepository,
     ExtDataRepository,
     DashboardRepository,
+    StationDataRollupsRepository,
+    AvailabilityRepository,
 )
+from .caches import ConfigEntitiesCache, ExtDataCache, StationDataAggregates, StationDataCache, StationDataStore
 
 
 class RepositoryContainer(Module):
 
     def configure(self, binder: Binder):
+        binder.bind(ConfigEntitiesCache, scope=singleton)
+        binder.bind(ExtDataCache, scope=singleton)
+        binder.bind(StationDataCache, scope=singleton)
+        binder.bind(StationDataAggregates, scope=singleton)
+        binder.bind(StationDataStore, scope=singleton)
+
         binder.bind(IMessagesRepository, to=MessagesRepository, scope=noscope)
         binder.bind(IStationsRepository, to=StationsRepository, scope=noscope)
         binder.bind(IStationsDataRepository, to=StationsDataRepository, scope=noscope)
@@ -39,3 +50,5 @@ class RepositoryContainer(Module):
         binder.bind(IChatsRepository, to=ChatsRepository, scope=noscope)
         binder.bind(IExtDataRepository, to=ExtDataRepository, scope=noscope)
         binder.bind(IDashboardRepository, to=DashboardRepository, scope=noscope)
+        binder.bind(IStationDataRollupsRepository, to=StationDataRollupsRepository, scope=noscope)
+        binder.bind(IAvailabilityRepository, to=AvailabilityRepository, scope=noscope)
@@ -1,6 +1,7 @@
 from .users import UsersRepository
 from .stations import StationsRepository
 from .stations_data import StationsDataRepository
+from .station_data_rollups import StationDataRollupsRepository
 from .visits_counter import VisitsCounterRepository
 from .messages import MessagesRepository
 from .bots import BotsRepository
@@ -8,8 +9,10 @@ from .lookups import LookupsRepository
 from .chats import ChatsRepository
 from .ext_data import ExtDataRepository
 from .dashboard import DashboardRepository
+from .availability import AvailabilityRepository
 
 
 __all__ = [UsersRepository, MessagesRepository, BotsRepository, StationsRepository,
            StationsDataRepository, VisitsCounterRepository, LookupsRepository,
-           ChatsRepository, ExtDataRepository, DashboardRepository]
\ No newline at end of file
+           ChatsRepository, ExtDataRepository, DashboardRepository,
+           StationDataRollupsRepository, AvailabilityRepository]
\ No newline at end of file
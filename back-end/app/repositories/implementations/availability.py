@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import List, Optional
+
+from beanie import PydanticObjectId
+
+from ..interfaces.availability import IAvailabilityRepository
+from shared.models import AvailabilityPeriod
+
+
+class AvailabilityRepository(IAvailabilityRepository):
+
+    async def get_open_period(self, building_id: PydanticObjectId) -> Optional[AvailabilityPeriod]:
+        return await AvailabilityPeriod.find_one({
+            "building_id": building_id,
+            "end_time": None,
+        })
+
+    async def get_period_at(self, building_id: PydanticObjectId, date: datetime) -> Optional[AvailabilityPeriod]:
+        return await AvailabilityPeriod.find_one({
+            "building_id": building_id,
+            "start_time": {"$lte": date},
+            "$or": [{"end_time": None}, {"end_time": {"$gt": date}}],
+        })
+
+    async def get_last_period_before(self, building_id: PydanticObjectId, date: datetime) -> Optional[AvailabilityPeriod]:
+        periods = await AvailabilityPeriod.find(
+            AvailabilityPeriod.building_id == building_id,
+            AvailabilityPeriod.start_time < date,
+        ).sort(
+            -AvailabilityPeriod.start_time
+        ).limit(1).to_list()
+        return periods[0] if periods else None
+
+    async def get_periods(
+        self,
+        building_ids: List[PydanticObjectId],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[AvailabilityPeriod]:
+        return await AvailabilityPeriod.find({
+            "building_id": {"$in": building_ids},
+            "start_time": {"$lt": end_date},
+            "$or": [{"end_time": None}, {"end_time": {"$gt": start_date}}],
+        }).sort(
+            AvailabilityPeriod.building_id,
+            AvailabilityPeriod.start_time,
+        ).to_list()
+
+    async def save_period(self, period: AvailabilityPeriod):
+        await period.save()
+
+    async def insert_periods(self, periods: List[AvailabilityPeriod]):
+        if periods:
+            await AvailabilityPeriod.insert_many(periods)
+
+    async def delete_periods_from(self, building_id: PydanticObjectId, date: datetime):
+        await AvailabilityPeriod.find(
+            AvailabilityPeriod.building_id == building_id,
+            AvailabilityPeriod.start_time >= date,
+        ).delete()
+
+    async def delete_building_periods(self, building_id: PydanticObjectId):
+        await AvailabilityPeriod.find(
+            AvailabilityPeriod.building_id == building_id,
+        ).delete()
@@ -1,12 +1,18 @@
 from typing import List
 
 from beanie import PydanticObjectId
+from injector import inject
 
+from ..caches import ConfigEntitiesCache
 from ..interfaces.bots import IBotsRepository
 from shared.models.bot import Bot
 
 
+@inject
 class BotsRepository(IBotsRepository):
+    def __init__(self, cache: ConfigEntitiesCache):
+        self._cache = cache
+
     async def get_bots(self, all: bool) -> List[Bot]:
         query = {} if all else { "enabled": True }
         return await Bot.find(query).to_list()
@@ -26,6 +32,7 @@ class BotsRepository(IBotsRepository):
         for key, value in data.items():
             setattr(bot, key, value)
         await bot.save()
+        self._cache.refresh_link(bot)
         return bot
     
     async def get_is_hook_enabled(self, bot_id: PydanticObjectId) -> bool:
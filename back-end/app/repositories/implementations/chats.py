@@ -2,29 +2,36 @@ from datetime import datetime, timezone
 from typing import List
 
 from beanie import PydanticObjectId
+from injector import inject
 
 from shared.models.bot import Bot
 
+from ..caches import ConfigEntitiesCache
 from ..interfaces.chats import IChatsRepository
 from shared.models.allowed_chat import AllowedChat
 from shared.models.chat_request import ChatRequest
 
 
+@inject
 class ChatsRepository(IChatsRepository):
 
+    def __init__(self, cache: ConfigEntitiesCache):
+        self._cache = cache
+
     async def get_chat_requests(self) -> List[ChatRequest]:
         return await ChatRequest.find(fetch_links=True).to_list()
 
     async def get_allowed_chats(self) -> List[AllowedChat]:
-        return await AllowedChat.find(fetch_links=True).to_list()
+        return await self._cache.get_or_load(
+            AllowedChat,
+            lambda: AllowedChat.find(fetch_links=True).to_list(),
+        )
 
     async def get_is_chat_allowed(self, chat_id: str, bot_id: PydanticObjectId) -> bool:
-        chat = await AllowedChat.find_one(
-            AllowedChat.chat_id == chat_id,
-            AllowedChat.bot.id == bot_id,
-            fetch_links=True,
+        return any(
+            chat.chat_id == chat_id and chat.bot.id == bot_id
+            for chat in await self.get_allowed_chats()
         )
-        return chat is not None
 
     async def add_chat_request(self, chat_id: str, bot_id: PydanticObjectId):
         existing_request = await ChatRequest.find_one(
@@ -51,6 +58,7 @@ class ChatsRepository(IChatsRepository):
         )
         await allowed.insert()
         await request.delete()
+        self._cache.invalidate(AllowedChat)
 
     async def reject_chat_request(self, id: PydanticObjectId):
         request = await ChatRequest.get(id)
@@ -69,4 +77,5 @@ class ChatsRepository(IChatsRepository):
         )
         await chat.delete()
         await request.insert()
+        self._cache.invalidate(AllowedChat)
         
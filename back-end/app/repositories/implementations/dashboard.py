@@ -1,31 +1,55 @@
 from typing import List
 from beanie import PydanticObjectId
+from injector import inject
 
 from shared.models.building import Building
 from shared.models.dashboard_config import DashboardConfig
+from ..caches import ConfigEntitiesCache
 from ..interfaces.dashboard import IDashboardRepository
 
+@inject
 class DashboardRepository(IDashboardRepository):
 
+    def __init__(self, cache: ConfigEntitiesCache):
+        self._cache = cache
+
+    async def _get_all_buildings(self) -> List[Building]:
+        return await self._cache.get_or_load(
+            Building,
+            lambda: Building.find(fetch_links=True).to_list(),
+        )
+
     async def get_building(self, id: PydanticObjectId) -> Building:
         return await Building.get(id, fetch_links=True)
     
     async def edit_building(self, building: Building):
         await building.save()
+        self._cache.invalidate(Building)
 
     async def create_building(self, building: Building) -> PydanticObjectId:
         await building.insert()
+        self._cache.invalidate(Building)
         return building.id
 
     async def delete_building(self, building: Building):
         await building.delete()
+        self._cache.invalidate(Building)
 
     async def get_buildings(self, ids: List[PydanticObjectId] = None, all: bool = False) -> List[Building]:
+        buildings = await self._get_all_buildings()
         if ids is not None:
-            return await Building.find({"_id": {"$in": ids}}, fetch_links=True).to_list()
+            ids = set(ids)
+            return [building for building in buildings if building.id in ids]
         if all:
-            return await Building.find(fetch_links=True).to_list()
-        return await Building.find({"enabled": True}, fetch_links=True).to_list()
+            return buildings
+        return [building for building in buildings if building.enabled]
+
+    async def get_buildings_by_report_user(self, user_id: PydanticObjectId) -> List[Building]:
+        return [
+            building
+            for building in await self._get_all_buildings()
+            if any(user and user.id == user_id for user in building.report_users or [])
+        ]
 
     async def get_config(self) -> DashboardConfig:
         return await DashboardConfig.find_one()
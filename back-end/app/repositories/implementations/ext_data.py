@@ -1,10 +1,12 @@
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Literal
+from typing import AsyncGenerator, Dict, List, Literal
 from beanie import PydanticObjectId
+from injector import inject
 from pymongo import ASCENDING, DESCENDING
 
 from .base import BaseReadRepository
+from ..caches import ExtDataCache
 from shared.models.ext_data import ExtData
 from app.models.sorting_config import SortingConfig
 from ..interfaces import DataQuery
@@ -14,9 +16,13 @@ from ..interfaces.ext_data import IExtDataRepository
 logger = logging.getLogger(__name__)
 
 
+@inject
 class ExtDataRepository(IExtDataRepository, BaseReadRepository[ExtData]):
     model = ExtData
 
+    def __init__(self, cache: ExtDataCache):
+        self._cache = cache
+
     def build_reference_joins(self, sorting: SortingConfig | None) -> list[dict]:
         if sorting and sorting.column == "user_id":
             return [
@@ -52,14 +58,70 @@ class ExtDataRepository(IExtDataRepository, BaseReadRepository[ExtData]):
     async def get_ext_data_by_id(self, ext_data_id: PydanticObjectId) -> ExtData:
         return await ExtData.get(ext_data_id)
 
+    async def _load_last_ext_data(
+        self,
+        user_ids: List[PydanticObjectId],
+        replace: bool = False,
+    ) -> Dict[PydanticObjectId, ExtData]:
+        pipeline = [
+            {"$match": {"user_id": {"$in": user_ids}}},
+            {"$sort": {"user_id": 1, "received_at": -1}},
+            {"$group": {"_id": "$user_id", "document": {"$first": "$$ROOT"}}},
+        ]
+        result = await ExtData.aggregate(pipeline).to_list()
+
+        documents = {}
+        for item in result:
+            ext_data = ExtData(**item["document"])
+            if replace:
+                self._cache.set(ext_data)
+            else:
+                self._cache.add(ext_data)
+            documents[item["_id"]] = ext_data
+        return documents
+
+    async def refresh_cache(self):
+        user_ids = self._cache.user_ids
+        if not user_ids:
+            return
+
+        documents = await self._load_last_ext_data(user_ids, replace=True)
+        for user_id in user_ids:
+            if user_id not in documents:
+                self._cache.remove(user_id)
+
     async def get_last_ext_data_by_user_id(self, user_id: PydanticObjectId) -> ExtData:
+        ext_data = self._cache.get_latest(user_id)
+        if ext_data is not None:
+            return ext_data
+
         documents = await ExtData.find(
             ExtData.user_id == user_id,
-            fetch_links = True
         ).sort(
             -ExtData.received_at
-        ).to_list()
-        return documents[0] if documents else None
+        ).limit(1).to_list()
+        if not documents:
+            return None
+
+        self._cache.add(documents[0])
+        return documents[0]
+
+    async def get_last_ext_data_by_user_ids(
+        self,
+        user_ids: List[PydanticObjectId],
+    ) -> Dict[PydanticObjectId, ExtData]:
+        result = {}
+        missing = []
+        for user_id in user_ids:
+            ext_data = self._cache.get_latest(user_id)
+            if ext_data is None:
+                missing.append(user_id)
+            else:
+                result[user_id] = ext_data
+
+        if missing:
+            result.update(await self._load_last_ext_data(missing))
+        return result
 
     async def add_ext_data(
         self,
@@ -73,12 +135,14 @@ class ExtDataRepository(IExtDataRepository, BaseReadRepository[ExtData]):
             received_at = date,
         )
         await ext_data.insert()
+        self._cache.add(ext_data)
         return ext_data.id
 
     async def delete(self, ext_data_id: PydanticObjectId) -> bool:
         ext_data = await ExtData.get(ext_data_id)
         if ext_data:
             await ext_data.delete()
+            self._cache.remove(ext_data.user_id)
             return True
         return False
 
@@ -98,6 +162,23 @@ class ExtDataRepository(IExtDataRepository, BaseReadRepository[ExtData]):
 
         return ext_data
 
+    async def iter_grid_states(
+        self,
+        user_id: PydanticObjectId,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> AsyncGenerator[tuple[datetime, bool], None]:
+        cursor = ExtData.get_pymongo_collection().find(
+            {"user_id": user_id, "received_at": {"$gte": start_date, "$lte": end_date}},
+            projection={"_id": 0, "received_at": 1, "grid_state": 1},
+            sort=[("received_at", ASCENDING)],
+        )
+        try:
+            async for document in cursor:
+                yield document["received_at"], document["grid_state"]
+        finally:
+            await cursor.close()
+
     async def get_last_ext_data_before_date(self, user_id: int, before_date: datetime):
         try:
             docs = await ExtData.find(
@@ -118,3 +199,4 @@ class ExtDataRepository(IExtDataRepository, BaseReadRepository[ExtData]):
         await ExtData.find(
             ExtData.received_at < timeout
         ).delete()
+        self._cache.clear()
@@ -3,10 +3,12 @@ from datetime import datetime, timezone
 from typing import List
 
 from beanie import PydanticObjectId
+from injector import inject
 
 from shared.models.bot import Bot
 from shared.models.station import Station
 
+from ..caches import ConfigEntitiesCache
 from ..interfaces.messages import IMessagesRepository
 from shared.models.message import Message
 
@@ -14,13 +16,20 @@ from shared.models.message import Message
 logger = logging.getLogger(__name__)
 
 
+@inject
 class MessagesRepository(IMessagesRepository):
+    def __init__(self, cache: ConfigEntitiesCache):
+        self._cache = cache
+
     async def _get_message(self, message_id: PydanticObjectId, with_links: bool) -> Message:
         return await Message.find_one(Message.id == message_id, fetch_links=True)
 
     async def get_messages(self, all: bool = False) -> List[Message]:
-        query = {} if all else {"enabled": True}
-        return await Message.find(query, fetch_links=True).to_list()
+        messages = await self._cache.get_or_load(
+            Message,
+            lambda: Message.find(fetch_links=True).to_list(),
+        )
+        return messages if all else [message for message in messages if message.enabled]
 
     async def get_message(self, message_id: PydanticObjectId) -> Message:
         return await self._get_message(message_id, True)
@@ -30,6 +39,7 @@ class MessagesRepository(IMessagesRepository):
         if message:
             message.enabled = state
             await message.save()
+            self._cache.invalidate(Message)
 
     async def create(self, data: dict) -> Message:
         message = Message()
@@ -45,7 +55,9 @@ class MessagesRepository(IMessagesRepository):
             else:
                 logger.warning(f"No attr {key} in Message")
 
-        return await message.insert()
+        message = await message.insert()
+        self._cache.invalidate(Message)
+        return message
 
     async def update(self, message_id: PydanticObjectId, data: dict) -> Message:
         message = await Message.get(message_id)
@@ -63,6 +75,7 @@ class MessagesRepository(IMessagesRepository):
             else:
                 logger.warning(f"No attr {key} in Message")
         await message.save()
+        self._cache.invalidate(Message)
         return message
 
     async def set_last_sent(self, message_id: PydanticObjectId):
@@ -71,3 +84,7 @@ class MessagesRepository(IMessagesRepository):
             return
         message.last_sent_time = datetime.now(timezone.utc)
         await message.save()
+
+        cached = self._cache.find(Message, message_id)
+        if cached:
+            cached.last_sent_time = message.last_sent_time
@@ -0,0 +1,189 @@
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from beanie import PydanticObjectId
+
+from ..interfaces.station_data_rollups import IStationDataRollupsRepository
+from shared.models import StationData, StationDataRollup
+
+
+logger = logging.getLogger(__name__)
+
+
+def _merge_stage() -> dict:
+    return {
+        "$merge": {
+            "into": StationDataRollup.Settings.name,
+            "on": ["station_id", "period", "start_time"],
+            "whenMatched": "replace",
+            "whenNotMatched": "insert",
+        }
+    }
+
+
+def _seconds_when(condition: dict) -> dict:
+    return {"$sum": {"$cond": [condition, "$duration", 0]}}
+
+
+class StationDataRollupsRepository(IStationDataRollupsRepository):
+
+    async def rollup_hours(self, start_date: datetime, end_date: datetime, max_gap_seconds: int, timezone: str):
+        charge_power = {"$ifNull": ["$charge_power", 0]}
+        discharge_power = {"$ifNull": ["$discharge_power", 0]}
+        generation_power = {"$ifNull": ["$generation_power", 0]}
+        wire_power = {"$ifNull": ["$wire_power", 0]}
+
+        pipeline = [
+            {"$match": {"last_update_time": {"$gte": start_date, "$lt": end_date}}},
+            {
+                "$setWindowFields": {
+                    "partitionBy": "$station_id",
+                    "sortBy": {"last_update_time": 1},
+                    "output": {
+                        "next_update_time": {
+                            "$shift": {"output": "$last_update_time", "by": 1}
+                        },
+                    },
+                }
+            },
+            {
+                "$set": {
+                    "duration": {
+                        "$cond": [
+                            {"$eq": ["$next_update_time", None]},
+                            0,
+                            {
+                                "$min": [
+                                    {"$divide": [{"$subtract": ["$next_update_time", "$last_update_time"]}, 1000]},
+                                    max_gap_seconds,
+                                ]
+                            },
+                        ]
+                    },
+                }
+            },
+            {
+                "$group": {
+                    "_id": {
+                        "station_id": "$station_id",
+                        "start_time": {"$dateTrunc": {"date": "$last_update_time", "unit": "hour", "timezone": timezone}},
+                    },
+                    "samples_count": {"$sum": 1},
+                    "battery_soc_min": {"$min": "$battery_soc"},
+                    "battery_soc_avg": {"$avg": "$battery_soc"},
+                    "battery_soc_max": {"$max": "$battery_soc"},
+                    "consumption_kwh": {
+                        "$sum": {"$multiply": [{"$ifNull": ["$consumption_power", 0]}, "$duration"]}
+                    },
+                    "generation_kwh": {
+                        "$sum": {"$multiply": [generation_power, "$duration"]}
+                    },
+                    "grid_seconds": _seconds_when({"$ne": [wire_power, 0]}),
+                    "generator_seconds": _seconds_when({
+                        "$and": [
+                            {"$gt": [{"$multiply": [charge_power, -1]}, 200]},
+                            {"$gt": [generation_power, 0]},
+                            {"$eq": [wire_power, 0]},
+                        ]
+                    }),
+                    "battery_seconds": _seconds_when({"$gt": [discharge_power, 200]}),
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "station_id": "$_id.station_id",
+                    "period": "hour",
+                    "start_time": "$_id.start_time",
+                    "samples_count": 1,
+                    "battery_soc_min": 1,
+                    "battery_soc_avg": 1,
+                    "battery_soc_max": 1,
+                    "consumption_kwh": {"$divide": ["$consumption_kwh", 3_600_000]},
+                    "generation_kwh": {"$divide": ["$generation_kwh", 3_600_000]},
+                    "grid_seconds": 1,
+                    "generator_seconds": 1,
+                    "battery_seconds": 1,
+                }
+            },
+            _merge_stage(),
+        ]
+
+        await StationData.aggregate(pipeline).to_list()
+        logger.info(f"station data hourly rollups updated for {start_date} - {end_date}")
+
+    async def rollup_days(self, start_date: datetime, end_date: datetime, timezone: str):
+        day_start = {"$dateTrunc": {"date": "$start_time", "unit": "day", "timezone": timezone}}
+
+        pipeline = [
+            {
+                "$match": {
+                    "period": "hour",
+                    "start_time": {"$gte": start_date, "$lt": end_date},
+                }
+            },
+            {
+                "$group": {
+                    "_id": {"station_id": "$station_id", "start_time": day_start},
+                    "samples_count": {"$sum": "$samples_count"},
+                    "battery_soc_min": {"$min": "$battery_soc_min"},
+                    "battery_soc_sum": {
+                        "$sum": {"$multiply": [{"$ifNull": ["$battery_soc_avg", 0]}, "$samples_count"]}
+                    },
+                    "battery_soc_max": {"$max": "$battery_soc_max"},
+                    "consumption_kwh": {"$sum": "$consumption_kwh"},
+                    "generation_kwh": {"$sum": "$generation_kwh"},
+                    "grid_seconds": {"$sum": "$grid_seconds"},
+                    "generator_seconds": {"$sum": "$generator_seconds"},
+                    "battery_seconds": {"$sum": "$battery_seconds"},
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "station_id": "$_id.station_id",
+                    "period": "day",
+                    "start_time": "$_id.start_time",
+                    "samples_count": 1,
+                    "battery_soc_min": 1,
+                    "battery_soc_avg": {
+                        "$cond": [
+                            {"$gt": ["$samples_count", 0]},
+                            {"$divide": ["$battery_soc_sum", "$samples_count"]},
+                            None,
+                        ]
+                    },
+                    "battery_soc_max": 1,
+                    "consumption_kwh": 1,
+                    "generation_kwh": 1,
+                    "grid_seconds": 1,
+                    "generator_seconds": 1,
+                    "battery_seconds": 1,
+                }
+            },
+            _merge_stage(),
+        ]
+
+        await StationDataRollup.aggregate(pipeline).to_list()
+        logger.info(f"station data daily rollups updated for {start_date} - {end_date}")
+
+    async def get_rollups(
+        self,
+        station_ids: Optional[List[PydanticObjectId]],
+        period: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[StationDataRollup]:
+        query: dict = {
+            "period": period,
+            "start_time": {"$gte": start_date, "$lte": end_date},
+        }
+        if station_ids:
+            query["station_id"] = {"$in": station_ids}
+
+        return await (
+            StationDataRollup.find(query)
+            .sort(StationDataRollup.station_id, StationDataRollup.start_time)
+            .to_list()
+        )
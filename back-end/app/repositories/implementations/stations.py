@@ -4,7 +4,9 @@ import traceback
 from typing import List
 
 from beanie import PydanticObjectId
+from injector import inject
 
+from ..caches import ConfigEntitiesCache
 from ..interfaces.stations import IStationsRepository
 from shared.models.station import Station
 from app.models.deye import DeyeStation
@@ -13,8 +15,12 @@ from app.models.deye import DeyeStation
 logger = logging.getLogger(__name__)
 
 
+@inject
 class StationsRepository(IStationsRepository):
 
+    def __init__(self, cache: ConfigEntitiesCache):
+        self._cache = cache
+
     async def get_stations(self, all: bool = False) -> List[Station]:
         query = {} if all else {"enabled": True}
         return await Station.find(query).sort(Station.order).to_list()
@@ -40,6 +46,7 @@ class StationsRepository(IStationsRepository):
         station.order = order
         station.battery_capacity = battery_capacity
         await station.save()
+        self._cache.refresh_link(station)
 
     async def add_station(self, station: DeyeStation):
         try:
@@ -83,6 +90,7 @@ class StationsRepository(IStationsRepository):
                     station.last_update_time, timezone.utc
                 )
                 await existing_station.save()
+                self._cache.refresh_link(existing_station)
 
         except Exception as e:
             logger.error(f"Error inserting station:", exc_info=True)
@@ -1,14 +1,17 @@
 import logging
 from datetime import datetime, timedelta, timezone
 import traceback
-from typing import List, Optional, get_origin, get_args
+from typing import AsyncIterator, Dict, List, Optional, get_origin, get_args
 
 from beanie import PydanticObjectId
 from injector import inject
+from pymongo.errors import BulkWriteError
 
 from app.settings import Settings
-from app.models import AssumedStationStatus, StationStatisticData
+from app.models import AssumedStationStatus, ChargeDurations, DownsamplingMode, StationStatisticData
+from app.utils import average_buckets, largest_triangle_three_buckets
 from ..interfaces.stations_data import IStationsDataRepository
+from ..caches import StationDataAggregates, StationDataCache, StationDataStore
 from shared.models import Station, StationData
 from app.models.deye import DeyeStationData
 
@@ -18,42 +21,157 @@ logger = logging.getLogger(__name__)
 
 @inject
 class StationsDataRepository(IStationsDataRepository):
+    CHART_COLUMNS = ("battery_soc", "discharge_power", "charge_power", "consumption_power")
 
     def __init__(
         self,
         settings: Settings,
+        cache: StationDataCache,
+        aggregates: StationDataAggregates,
+        store: StationDataStore,
     ):
         self._settings = settings
-
-    async def add_station_data(self, station: Station, station_data: DeyeStationData):
-        try:
+        self._cache = cache
+        self._aggregates = aggregates
+        self._store = store
+
+    def _remember(self, station_data: StationData):
+        self._cache.add(station_data)
+        self._aggregates.add(station_data)
+        self._store.add(station_data)
+
+    def _get_refresh_window(self) -> timedelta:
+        return timedelta(seconds=max(
+            self._settings.DEYE_FETCH_INTERVAL * 3,
+            self._settings.DEYE_REPORT_INTERVAL * self._settings.DEYE_ASSUMED_OFFLINE_REPORTS,
+        ))
+
+    async def _load_latest_samples(self, since: datetime | None = None) -> int:
+        pipeline = []
+        if since is not None:
+            pipeline.append({"$match": {"last_update_time": {"$gte": since}}})
+
+        pipeline += [
+            {"$sort": {"station_id": 1, "last_update_time": -1}},
+            {
+                "$group": {
+                    "_id": "$station_id",
+                    "samples": {
+                        "$firstN": {
+                            "input": "$$ROOT",
+                            "n": StationDataCache.LATEST_SAMPLES_COUNT,
+                        }
+                    },
+                }
+            },
+        ]
+        result = await StationData.aggregate(pipeline).to_list()
+        for item in result:
+            for sample in reversed(item["samples"]):
+                self._remember(StationData(**sample))
+            if since is None and len(item["samples"]) < StationDataCache.LATEST_SAMPLES_COUNT:
+                self._cache.set_complete(item["_id"])
+        return len(result)
+
+    async def _init_aggregates(self):
+        start = self._aggregates.get_bootstrap_start()
+        pipeline = [
+            {"$match": {"last_update_time": {"$gte": start}}},
+            {
+                "$group": {
+                    "_id": {
+                        "station_id": "$station_id",
+                        "minute": {"$dateTrunc": {"date": "$last_update_time", "unit": "minute"}},
+                    },
+                    "count": {"$sum": 1},
+                    "last_update_time": {"$max": "$last_update_time"},
+                    **{
+                        column: {"$sum": {"$ifNull": [f"${column}", 0]}}
+                        for column in self._aggregates.columns
+                    },
+                }
+            },
+        ]
+        result = await StationData.aggregate(pipeline).to_list()
+        buckets = [
+            {**item, "station_id": item["_id"]["station_id"], "minute": item["_id"]["minute"]}
+            for item in result
+        ]
+        self._aggregates.init(start, buckets)
+        logger.info(f"station data aggregates initialized with {len(buckets)} buckets")
+
+    async def _init_store(self):
+        start = self._store.get_bootstrap_start()
+        self._store.reset()
+
+        count = 0
+        async for documents in self.iter_station_data_batches(
+            None,
+            start,
+            datetime.now(timezone.utc),
+            max(self._settings.STATISTIC_EXPORT_BATCH_SIZE, 1),
+        ):
+            self._store.load(documents)
+            count += len(documents)
+
+        self._store.set_covered_since(start)
+        logger.info(f"station data store initialized with {count} samples")
+
+    async def init_cache(self):
+        if self._aggregates.enabled:
+            await self._init_aggregates()
+        if self._store.enabled:
+            await self._init_store()
+        count = await self._load_latest_samples()
+        logger.info(f"station data cache initialized for {count} stations")
+
+    async def refresh_cache(self):
+        since = datetime.now(timezone.utc) - self._get_refresh_window()
+        await self._load_latest_samples(since)
+
+    async def add_stations_data(self, stations_data: List[tuple[Station, DeyeStationData]]) -> int:
+        records: List[StationData] = []
+        for station, station_data in stations_data:
             last_update_time = datetime.fromtimestamp(station_data.last_update_time, timezone.utc)
-            existing_record = await StationData.find_one(
-                StationData.station_id == station.id,
-                StationData.last_update_time == last_update_time,
-            )
+            if not self._cache.is_new(station.id, last_update_time):
+                continue
+
+            records.append(StationData(
+                station_id          = station.id,
+                battery_power       = station_data.battery_power,
+                battery_soc         = station_data.battery_soc,
+                charge_power        = station_data.charge_power,
+                code                = station_data.code,
+                consumption_power   = station_data.consumption_power,
+                discharge_power     = station_data.discharge_power,
+                generation_power    = station_data.generation_power,
+                grid_power          = station_data.grid_power,
+                irradiate_intensity = station_data.irradiate_intensity,
+                last_update_time    = last_update_time,
+                msg                 = station_data.msg,
+                purchase_power      = station_data.purchase_power,
+                request_id          = station_data.request_id,
+                wire_power          = station_data.wire_power
+            ))
+
+        if not records:
+            return 0
+
+        failed_indexes = set()
+        try:
+            await StationData.insert_many(records, ordered=False)
+        except BulkWriteError as e:
+            failed_indexes = {error["index"] for error in e.details.get("writeErrors", [])}
+            logger.error(f"Failed to insert {len(failed_indexes)} of {len(records)} station data records")
+        except Exception:
+            logger.error(f"Error inserting station data:", exc_info=True)
+            return 0
 
-            if not existing_record:
-                new_record = StationData(
-                    station_id          = station.id,
-                    battery_power       = station_data.battery_power,
-                    battery_soc         = station_data.battery_soc,
-                    charge_power        = station_data.charge_power,
-                    code                = station_data.code,
-                    consumption_power   = station_data.consumption_power,
-                    discharge_power     = station_data.discharge_power,
-                    generation_power    = station_data.generation_power,
-                    grid_power          = station_data.grid_power,
-                    irradiate_intensity = station_data.irradiate_intensity,
-                    last_update_time    = last_update_time,
-                    msg                 = station_data.msg,
-                    purchase_power      = station_data.purchase_power,
-                    request_id          = station_data.request_id,
-                    wire_power          = station_data.wire_power
-                )
-                await new_record.insert()
-        except Exception as e:
-            logger.error(f"Error updating station data:", exc_info=True)
+        inserted = [record for i, record in enumerate(records) if i not in failed_indexes]
+        for record in inserted:
+            self._remember(record)
+
+        return len(inserted)
 
     async def get_full_station_data(self, station_id: PydanticObjectId, last_seconds: int) -> List[StationData]:
         try:
@@ -105,26 +223,261 @@ class StationsDataRepository(IStationsDataRepository):
             return []
 
 
-    async def get_last_station_data(
-        self,
-        station_id: PydanticObjectId,
-    ) -> StationData:
-        station = await (
+    async def _get_latest_samples(self, station_id: PydanticObjectId, count: int) -> List[StationData]:
+        samples = self._cache.get_latest_samples(station_id)
+        if len(samples) >= count or self._cache.is_complete(station_id):
+            return samples[:count]
+
+        samples = await (
             StationData.find(
                 StationData.station_id == station_id,
             )
             .sort(-StationData.last_update_time)
-            .first_or_none()
+            .limit(StationDataCache.LATEST_SAMPLES_COUNT)
+            .to_list()
         )
-        return station
+        for sample in reversed(samples):
+            self._remember(sample)
+        if len(samples) < StationDataCache.LATEST_SAMPLES_COUNT:
+            self._cache.set_complete(station_id)
+        return samples[:count]
 
-    async def get_station_data_average_column(
+    async def get_charge_durations(
         self,
-        start_date: datetime | None,
-        end_date: datetime | None,
-        station_id: int,
-        column_name: str,
-    ) -> float:
+        station_id: PydanticObjectId,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> ChargeDurations:
+        charge_power = {"$ifNull": ["$charge_power", 0]}
+        generation_power = {"$ifNull": ["$generation_power", 0]}
+        wire_power = {"$ifNull": ["$wire_power", 0]}
+
+        pipeline = [
+            {
+                "$match": {
+                    "station_id": station_id,
+                    "last_update_time": {"$gte": start_date, "$lte": end_date},
+                }
+            },
+            {
+                "$setWindowFields": {
+                    "sortBy": {"last_update_time": 1},
+                    "output": {
+                        "next_update_time": {
+                            "$shift": {"output": "$last_update_time", "by": 1}
+                        },
+                    },
+                }
+            },
+            {
+                "$match": {
+                    "next_update_time": {"$ne": None},
+                    "$expr": {"$gt": [{"$multiply": [charge_power, -1]}, 200]},
+                }
+            },
+            {
+                "$group": {
+                    "_id": {
+                        "$switch": {
+                            "branches": [
+                                {
+                                    "case": {"$and": [{"$gt": [generation_power, 0]}, {"$eq": [wire_power, 0]}]},
+                                    "then": "generator",
+                                },
+                                {
+                                    "case": {"$and": [{"$eq": [generation_power, 0]}, {"$eq": [wire_power, 0]}]},
+                                    "then": "recuperation",
+                                },
+                            ],
+                            "default": "grid",
+                        }
+                    },
+                    "milliseconds": {
+                        "$sum": {"$subtract": ["$next_update_time", "$last_update_time"]}
+                    },
+                }
+            },
+        ]
+
+        durations = ChargeDurations()
+        try:
+            result = await StationData.aggregate(pipeline).to_list()
+        except Exception as e:
+            logger.error(f"Error computing charge durations: {e}")
+            return durations
+
+        for item in result:
+            setattr(durations, f"{item['_id']}_seconds", item["milliseconds"] / 1000)
+        return durations
+
+    async def iter_station_data_batches(
+        self,
+        station_ids: Optional[List[PydanticObjectId]],
+        start_date: datetime,
+        end_date: datetime,
+        batch_size: int,
+    ) -> AsyncIterator[List[dict]]:
+        query: dict = {"last_update_time": {"$gte": start_date, "$lte": end_date}}
+        if station_ids:
+            query["station_id"] = {"$in": station_ids}
+
+        cursor = StationData.get_pymongo_collection().find(
+            query,
+            sort=[("station_id", 1), ("last_update_time", 1)],
+            batch_size=batch_size,
+            allow_disk_use=True,
+        )
+
+        batch = []
+        try:
+            async for document in cursor:
+                batch.append(document)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        finally:
+            await cursor.close()
+
+        if batch:
+            yield batch
+
+    def _get_stored_chart_rows(
+        self,
+        station_id: PydanticObjectId,
+        start_date: datetime,
+        end_date: datetime,
+        records_count: int | None,
+        mode: DownsamplingMode,
+    ) -> List[dict]:
+        rows = self._store.get_range(station_id, start_date, end_date, self.CHART_COLUMNS)
+        for row in rows:
+            for column in self.CHART_COLUMNS:
+                row[column] = row[column] or 0
+            row["charge_power"] = abs(row["charge_power"])
+
+        if records_count and mode == DownsamplingMode.AVERAGE:
+            rows = average_buckets(rows, records_count, self.CHART_COLUMNS)
+        return rows
+
+    async def _aggregate_chart_rows(
+        self,
+        station_id: PydanticObjectId,
+        start_date: datetime,
+        end_date: datetime,
+        records_count: int | None,
+        mode: DownsamplingMode,
+    ) -> List[dict]:
+        values = {
+            "battery_soc": {"$ifNull": ["$battery_soc", 0]},
+            "discharge_power": {"$ifNull": ["$discharge_power", 0]},
+            "charge_power": {"$abs": {"$ifNull": ["$charge_power", 0]}},
+            "consumption_power": {"$ifNull": ["$consumption_power", 0]},
+        }
+        pipeline: list = [
+            {
+                "$match": {
+                    "station_id": station_id,
+                    "last_update_time": {"$gte": start_date, "$lte": end_date},
+                }
+            },
+        ]
+
+        if records_count and mode == DownsamplingMode.AVERAGE:
+            pipeline += [
+                {
+                    "$bucketAuto": {
+                        "groupBy": "$last_update_time",
+                        "buckets": records_count,
+                        "output": {
+                            **{key: {"$avg": value} for key, value in values.items()},
+                            "timestamp": {"$avg": {"$toLong": "$last_update_time"}},
+                        },
+                    }
+                },
+                {
+                    "$project": {
+                        "_id": 0,
+                        **{key: 1 for key in values},
+                        "last_update_time": {"$toDate": "$timestamp"},
+                    }
+                },
+            ]
+        else:
+            pipeline.append({
+                "$project": {"_id": 0, **values, "last_update_time": 1}
+            })
+
+        pipeline.append({"$sort": {"last_update_time": 1}})
+
+        return await StationData.aggregate(pipeline).to_list()
+
+    async def get_chart_station_data(
+        self,
+        station_id: PydanticObjectId,
+        start_date: datetime,
+        end_date: datetime,
+        records_count: int | None,
+        mode: DownsamplingMode = DownsamplingMode.AVERAGE,
+    ) -> List[dict]:
+        try:
+            if self._store.covers(start_date, self.CHART_COLUMNS):
+                rows = self._get_stored_chart_rows(station_id, start_date, end_date, records_count, mode)
+            else:
+                rows = await self._aggregate_chart_rows(station_id, start_date, end_date, records_count, mode)
+        except Exception as e:
+            logger.error(f"Error fetching chart station data: {e}")
+            return []
+
+        if records_count and mode == DownsamplingMode.LTTB:
+            rows = largest_triangle_three_buckets(rows, records_count, self.CHART_COLUMNS)
+
+        return rows
+
+    async def get_last_station_data(
+        self,
+        station_id: PydanticObjectId,
+    ) -> StationData:
+        samples = await self._get_latest_samples(station_id, 1)
+        return samples[0] if samples else None
+
+    async def get_last_stations_data(
+        self,
+        station_ids: List[PydanticObjectId],
+    ) -> Dict[PydanticObjectId, StationData]:
+        result = {}
+        missing = []
+        for station_id in station_ids:
+            station_data = self._cache.get_latest(station_id)
+            if station_data is None:
+                missing.append(station_id)
+            else:
+                result[station_id] = station_data
+
+        if missing:
+            pipeline = [
+                {"$match": {"station_id": {"$in": missing}}},
+                {"$sort": {"station_id": 1, "last_update_time": -1}},
+                {
+                    "$group": {
+                        "_id": "$station_id",
+                        "samples": {
+                            "$firstN": {
+                                "input": "$$ROOT",
+                                "n": StationDataCache.LATEST_SAMPLES_COUNT,
+                            }
+                        },
+                    }
+                },
+            ]
+            for item in await StationData.aggregate(pipeline).to_list():
+                samples = [StationData(**sample) for sample in item["samples"]]
+                for sample in reversed(samples):
+                    self._remember(sample)
+                result[item["_id"]] = samples[0]
+
+        return result
+
+    def _validate_numeric_column(self, column_name: str):
         if column_name not in StationData.model_fields:
             raise ValueError(f"Field '{column_name}' does not exist in StationData model.")
 
@@ -140,9 +493,26 @@ class StationsDataRepository(IStationsDataRepository):
                 f"Field '{column_name}' is not numeric (expected int or float; got {field_type})"
             )
 
-        match: dict = {
-            "station_id": station_id,
-        }
+    def _get_cached_average(
+        self,
+        station_id: PydanticObjectId,
+        column_name: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> float | None:
+        average = self._aggregates.get_average(station_id, column_name, start_date, end_date)
+        if average is not None:
+            return average
+        return self._store.get_average(station_id, column_name, start_date, end_date)
+
+    def _build_average_pipeline(
+        self,
+        match: dict,
+        group_id,
+        column_name: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> list:
 
         if start_date or end_date:
             match["last_update_time"] = {}
@@ -154,11 +524,11 @@ class StationsDataRepository(IStationsDataRepository):
             if not match["last_update_time"]:
                 del match["last_update_time"]
 
-        pipeline = [
+        return [
             {"$match": match},
             {
                 "$group": {
-                    "_id": None,
+                    "_id": group_id,
                     "avg_value": {
                         "$avg": {
                             "$ifNull": [f"${column_name}", 0]
@@ -168,6 +538,26 @@ class StationsDataRepository(IStationsDataRepository):
             },
         ]
 
+    async def get_station_data_average_column(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        station_id: int,
+        column_name: str,
+    ) -> float:
+        self._validate_numeric_column(column_name)
+
+        average = self._get_cached_average(station_id, column_name, start_date, end_date)
+        if average is not None:
+            return average
+
+        pipeline = self._build_average_pipeline(
+            {"station_id": station_id},
+            None,
+            column_name,
+            start_date,
+            end_date,
+        )
         result = await StationData.aggregate(pipeline).to_list()
 
         if not result or result[0].get("avg_value") is None:
@@ -175,23 +565,55 @@ class StationsDataRepository(IStationsDataRepository):
 
         return float(result[0]["avg_value"])
 
+    async def get_stations_data_average_column(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        station_ids: List[PydanticObjectId],
+        column_name: str,
+    ) -> Dict[PydanticObjectId, float]:
+        self._validate_numeric_column(column_name)
+
+        result = {}
+        missing = []
+        for station_id in station_ids:
+            average = self._get_cached_average(station_id, column_name, start_date, end_date)
+            if average is None:
+                missing.append(station_id)
+            else:
+                result[station_id] = average
+
+        if missing:
+            pipeline = self._build_average_pipeline(
+                {"station_id": {"$in": missing}},
+                "$station_id",
+                column_name,
+                start_date,
+                end_date,
+            )
+            averages = {
+                item["_id"]: float(item["avg_value"] or 0)
+                for item in await StationData.aggregate(pipeline).to_list()
+            }
+            for station_id in missing:
+                result[station_id] = averages.get(station_id, 0.0)
+
+        return result
+
     async def get_station_data_tuple(
         self,
         station_id: str,
     ) -> Optional[StationStatisticData]:
         try:
-            station = await Station.find_one(Station.station_id == station_id)
-            if not station:
-                return None
+            station_object_id = self._cache.get_station_object_id(station_id)
+            if station_object_id is None:
+                station = await Station.find_one(Station.station_id == station_id)
+                if not station:
+                    return None
+                station_object_id = station.id
+                self._cache.set_station_object_id(station_id, station_object_id)
 
-            stations = (
-                await StationData.find(
-                    StationData.station_id == station.id
-                )
-                .sort("-last_update_time")
-                .limit(2)
-                .to_list()
-            )
+            stations = await self._get_latest_samples(station_object_id, 2)
 
             if not stations:
                 return None
@@ -214,19 +636,17 @@ class StationsDataRepository(IStationsDataRepository):
         ).delete()
 
     async def get_assumed_connection_status(self, station_id: int) -> AssumedStationStatus:
-        station_data = await StationData.find(
-            StationData.station_id == station_id
-        ).sort(
-            -StationData.last_update_time
-        ).limit(1).to_list()
+        station_data = await self._get_latest_samples(station_id, 1)
+        return self.get_assumed_status(station_data[0] if station_data else None)
 
+    def get_assumed_status(self, station_data: Optional[StationData]) -> AssumedStationStatus:
         if not station_data:
             return AssumedStationStatus.OFFLINE
 
         report_interval_seconds: int = self._settings.DEYE_REPORT_INTERVAL
         offline_reports_cnt: int = self._settings.DEYE_ASSUMED_OFFLINE_REPORTS
 
-        latest_update = station_data[0].last_update_time.replace(tzinfo=timezone.utc)
+        latest_update = station_data.last_update_time.replace(tzinfo=timezone.utc)
         current_time = datetime.now(timezone.utc)
 
         time_elapsed = (current_time - latest_update).total_seconds()
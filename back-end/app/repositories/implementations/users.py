@@ -2,11 +2,18 @@ from datetime import datetime
 from typing import List
 
 from beanie import PydanticObjectId
+from injector import inject
+from shared.models.building import Building
 from shared.models.user import User
+from ..caches import ConfigEntitiesCache
 from ..interfaces.users import IUsersRepository
 
 
+@inject
 class UsersRepository(IUsersRepository):
+    def __init__(self, cache: ConfigEntitiesCache):
+        self._cache = cache
+
     async def get_user(self, user_name: str):
         return await User.find_one(User.is_active == True, User.name == user_name)
 
@@ -126,6 +133,7 @@ class UsersRepository(IUsersRepository):
         existing_user: User = await self.get_user_by_id(user_id)
         if existing_user:
             await existing_user.delete()
+            self._cache.invalidate(Building)
             return True
 
         return False
@@ -1,9 +1,11 @@
 from .base import DataQuery
+from .availability import IAvailabilityRepository
 from .users import IUsersRepository
 from .visits_counter import IVisitsCounterRepository
 from .messages import IMessagesRepository
 from .stations import IStationsRepository
 from .stations_data import IStationsDataRepository
+from .station_data_rollups import IStationDataRollupsRepository
 from .bots import IBotsRepository
 from .lookups import ILookupsRepository, LookupDefinition
 from .chats import IChatsRepository
@@ -14,4 +16,5 @@ from .dashboard import IDashboardRepository
 __all__ = [DataQuery, IBotsRepository, IUsersRepository, IMessagesRepository,
            ILookupsRepository, LookupDefinition, IStationsRepository, 
            IStationsDataRepository, IVisitsCounterRepository, IChatsRepository,
-           IExtDataRepository, IDashboardRepository]
\ No newline at end of file
+           IExtDataRepository, IDashboardRepository, IStationDataRollupsRepository,
+           IAvailabilityRepository]
\ No newline at end of file
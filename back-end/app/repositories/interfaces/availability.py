@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from beanie import PydanticObjectId
+
+from shared.models import AvailabilityPeriod
+
+
+class IAvailabilityRepository(ABC):
+
+    @abstractmethod
+    async def get_open_period(self, building_id: PydanticObjectId) -> Optional[AvailabilityPeriod]:
+        ...
+
+    @abstractmethod
+    async def get_period_at(self, building_id: PydanticObjectId, date: datetime) -> Optional[AvailabilityPeriod]:
+        ...
+
+    @abstractmethod
+    async def get_last_period_before(self, building_id: PydanticObjectId, date: datetime) -> Optional[AvailabilityPeriod]:
+        ...
+
+    @abstractmethod
+    async def get_periods(
+        self,
+        building_ids: List[PydanticObjectId],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[AvailabilityPeriod]:
+        ...
+
+    @abstractmethod
+    async def save_period(self, period: AvailabilityPeriod):
+        ...
+
+    @abstractmethod
+    async def insert_periods(self, periods: List[AvailabilityPeriod]):
+        ...
+
+    @abstractmethod
+    async def delete_periods_from(self, building_id: PydanticObjectId, date: datetime):
+        ...
+
+    @abstractmethod
+    async def delete_building_periods(self, building_id: PydanticObjectId):
+        ...
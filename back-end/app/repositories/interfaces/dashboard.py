@@ -29,6 +29,10 @@ class IDashboardRepository(ABC):
     async def get_buildings(self, ids: List[PydanticObjectId] = None, all: bool = False) -> List[Building]:
         ...
 
+    @abstractmethod
+    async def get_buildings_by_report_user(self, user_id: PydanticObjectId) -> List[Building]:
+        ...
+
     @abstractmethod
     async def get_config(self) -> DashboardConfig:
         ...
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List
+from typing import AsyncGenerator, Dict, List
 from beanie import PydanticObjectId
 
 from shared.models.ext_data import ExtData
@@ -16,10 +16,21 @@ class IExtDataRepository(ABC):
     async def get_ext_data_by_id(self, ext_data_id: PydanticObjectId) -> ExtData:
         ...
 
+    @abstractmethod
+    async def refresh_cache(self):
+        ...
+
     @abstractmethod
     async def get_last_ext_data_by_user_id(self, user_id: PydanticObjectId) -> ExtData:
         ...
 
+    @abstractmethod
+    async def get_last_ext_data_by_user_ids(
+        self,
+        user_ids: List[PydanticObjectId],
+    ) -> Dict[PydanticObjectId, ExtData]:
+        ...
+
     @abstractmethod
     async def add_ext_data(
         self,
@@ -42,6 +53,15 @@ class IExtDataRepository(ABC):
     ):
         ...
 
+    @abstractmethod
+    def iter_grid_states(
+        self,
+        user_id: PydanticObjectId,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> AsyncGenerator[tuple[datetime, bool], None]:
+        ...
+
     @abstractmethod
     async def get_last_ext_data_before_date(self, user_id: int, before_date: datetime):
         ...
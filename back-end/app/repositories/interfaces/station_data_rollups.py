@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from beanie import PydanticObjectId
+
+from shared.models import StationDataRollup
+
+
+class IStationDataRollupsRepository(ABC):
+
+    @abstractmethod
+    async def rollup_hours(self, start_date: datetime, end_date: datetime, max_gap_seconds: int, timezone: str):
+        ...
+
+    @abstractmethod
+    async def rollup_days(self, start_date: datetime, end_date: datetime, timezone: str):
+        ...
+
+    @abstractmethod
+    async def get_rollups(
+        self,
+        station_ids: Optional[List[PydanticObjectId]],
+        period: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[StationDataRollup]:
+        ...
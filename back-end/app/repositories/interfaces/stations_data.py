@@ -1,18 +1,26 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
 from beanie import PydanticObjectId
 
 from shared.models import Station, StationData
-from app.models import AssumedStationStatus, StationStatisticData
+from app.models import AssumedStationStatus, ChargeDurations, DownsamplingMode, StationStatisticData
 from app.models.deye import DeyeStationData
 
 
 class IStationsDataRepository(ABC):
 
     @abstractmethod
-    async def add_station_data(self, station: Station, station_data: DeyeStationData):
+    async def init_cache(self):
+        ...
+
+    @abstractmethod
+    async def refresh_cache(self):
+        ...
+
+    @abstractmethod
+    async def add_stations_data(self, stations_data: List[tuple[Station, DeyeStationData]]) -> int:
         ...
 
     @abstractmethod
@@ -28,14 +36,65 @@ class IStationsDataRepository(ABC):
     ) -> List[StationData]:
         ...
 
+    @abstractmethod
+    async def get_charge_durations(
+        self,
+        station_id: PydanticObjectId,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> ChargeDurations:
+        ...
+
+    @abstractmethod
+    def iter_station_data_batches(
+        self,
+        station_ids: Optional[List[PydanticObjectId]],
+        start_date: datetime,
+        end_date: datetime,
+        batch_size: int,
+    ) -> AsyncIterator[List[dict]]:
+        ...
+
+    @abstractmethod
+    async def get_chart_station_data(
+        self,
+        station_id: PydanticObjectId,
+        start_date: datetime,
+        end_date: datetime,
+        records_count: int | None,
+        mode: DownsamplingMode = DownsamplingMode.AVERAGE,
+    ) -> List[dict]:
+        ...
+
     @abstractmethod
     async def get_assumed_connection_status(self, station_id: int) -> AssumedStationStatus:
         ...
 
+    @abstractmethod
+    def get_assumed_status(self, station_data: Optional[StationData]) -> AssumedStationStatus:
+        ...
+
     @abstractmethod
     async def get_last_station_data(self, station_id: PydanticObjectId) -> StationData:
         ...
 
+    @abstractmethod
+    async def get_last_stations_data(
+        self,
+        station_ids: List[PydanticObjectId],
+    ) -> Dict[PydanticObjectId, StationData]:
+        ...
+
+    @abstractmethod
+    async def get_stations_data_average_column(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        station_ids: List[PydanticObjectId],
+        column_name: str,
+    ) -> Dict[PydanticObjectId, float]:
+        ...
+
     @abstractmethod
     async def get_station_data_average_column(
         self,
@@ -1,47 +1,82 @@
 from datetime import datetime, timezone
 from typing import List
 from beanie import PydanticObjectId
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from fastapi_injector import Injected
 
 from app.services import DashboardService
+from app.services.dashboard import SnapshotEntry
 from app.utils.jwt_dependencies import get_current_jwt_optional, jwt_required
 from app.models.api import SaveBuildingRequest, PowerLogsRequest, PowerLogsResponse
 from app.models.api.dashboard import (
     BuildingResponse,
     BuildingSummaryResponse,
     BuildingWithSummaryResponse,
+    BuildingOutagesReportResponse,
+    BuildingPowerLogsResponse,
+    BuildingsPowerLogsRequest,
     BuildingsSummaryRequest,
     DashboardConfigResponse,
     EditBuildingResponse,
+    OutagesReportRequest,
     SaveDashboardConfigRequest,
 )
 
 
+def snapshot_response(request: Request, entry: SnapshotEntry) -> Response:
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    etags = {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+    if entry.etag in etags:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(jsonable_encoder(entry.value), headers=headers)
+
+
+def parse_power_logs_range(body: PowerLogsRequest) -> tuple[datetime, datetime]:
+    try:
+        start_date = datetime.fromisoformat(body.start_date.replace("Z", "+00:00"))
+        end_date = datetime.fromisoformat(body.end_date.replace("Z", "+00:00"))
+
+        start_date = start_date.replace(tzinfo=timezone.utc) if start_date.tzinfo is None else start_date
+        end_date = end_date.replace(tzinfo=timezone.utc) if end_date.tzinfo is None else end_date
+
+        if start_date >= end_date:
+            raise HTTPException(status_code=400, detail="startDate must be before endDate")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid date format: {str(e)}")
+
+    return start_date, end_date
+
+
 def register(app: FastAPI):
 
-    @app.get("/api/dashboard/buildings")
+    @app.get("/api/dashboard/buildings", response_model=List[BuildingResponse])
     async def get_buildings(
+        request: Request,
         dashboard = Injected(DashboardService),
         current_claims: dict | None = Depends(get_current_jwt_optional),
-    ) -> List[BuildingResponse]:
+    ) -> Response:
         all = current_claims.get("sub", False) is not None if current_claims else False
-        return await dashboard.get_buildings(all=all)
+        return snapshot_response(request, await dashboard.get_buildings(all=all))
 
 
-    @app.post("/api/dashboard/buildings/summary")
+    @app.post("/api/dashboard/buildings/summary", response_model=List[BuildingSummaryResponse])
     async def get_buildings_summary(
+        request: Request,
         body: BuildingsSummaryRequest,
         dashboard = Injected(DashboardService),
-    ) -> List[BuildingSummaryResponse]:
-        return await dashboard.get_buildings_summary(body.building_ids)
+    ) -> Response:
+        return snapshot_response(request, await dashboard.get_buildings_summary(body.building_ids))
 
 
-    @app.get("/api/buildings/buildings")
+    @app.get("/api/buildings/buildings", response_model=List[BuildingWithSummaryResponse])
     async def get_buildings_data(
+        request: Request,
         dashboard = Injected(DashboardService),
-    ) -> List[BuildingWithSummaryResponse]:
-        return await dashboard.get_buildings_with_summary()
+    ) -> Response:
+        return snapshot_response(request, await dashboard.get_buildings_with_summary())
 
 
     @app.get("/api/dashboard/config")
@@ -105,6 +140,23 @@ def register(app: FastAPI):
         return { "success": result, "id": str(building_id) }
 
 
+    @app.post("/api/dashboard/buildings/power-logs")
+    async def get_buildings_power_logs(
+        body: BuildingsPowerLogsRequest,
+        dashboard = Injected(DashboardService),
+    ) -> List[BuildingPowerLogsResponse]:
+        start_date, end_date = parse_power_logs_range(body)
+        return await dashboard.get_buildings_power_logs(body.building_ids, start_date, end_date)
+
+
+    @app.post("/api/dashboard/outages/report")
+    async def get_outages_report(
+        body: OutagesReportRequest,
+        dashboard = Injected(DashboardService),
+    ) -> List[BuildingOutagesReportResponse]:
+        return await dashboard.get_outages_report(body.building_ids, body.start_date, body.end_date)
+
+
     @app.post("/api/dashboard/buildings/{building_id}/power-logs")
     @app.post("/api/buildings/{building_id}/power-logs")
     async def get_building_power_logs(
@@ -112,18 +164,7 @@ def register(app: FastAPI):
         body: PowerLogsRequest,
         dashboard = Injected(DashboardService),
     ) -> PowerLogsResponse:
-        try:
-            start_date = datetime.fromisoformat(body.start_date.replace("Z", "+00:00"))
-            end_date = datetime.fromisoformat(body.end_date.replace("Z", "+00:00"))
-
-            start_date = start_date.replace(tzinfo=timezone.utc) if start_date.tzinfo is None else start_date
-            end_date = end_date.replace(tzinfo=timezone.utc) if end_date.tzinfo is None else end_date
-
-            if start_date >= end_date:
-                raise HTTPException(status_code=400, detail="startDate must be before endDate")
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Invalid date format: {str(e)}")
-
+        start_date, end_date = parse_power_logs_range(body)
         power_logs = await dashboard.get_power_logs(building_id, start_date, end_date)
         if not power_logs:
             raise HTTPException(status_code=404, detail="Building not found or no power logs available")
@@ -17,6 +17,7 @@ from app.services import (
     MessagesService,
     TelegramService,
 )
+from app.utils import template_cache
 from app.utils.jwt_dependencies import jwt_required
 
 
@@ -42,6 +43,13 @@ def register(app: FastAPI):
         return await messages.get_messages(all=True)
 
 
+    @app.get("/api/messages/templateCache")
+    async def get_template_cache_stats(
+        _ = Depends(jwt_required),
+    ):
+        return template_cache.get_stats()
+
+
     @app.post("/api/messages/getChannel")
     def get_channel(
         channel_id: str = Body(..., alias="channelId"), 
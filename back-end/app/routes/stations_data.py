@@ -1,10 +1,11 @@
-from datetime import timedelta, timezone
-from statistics import mean
+from datetime import timezone
 from fastapi import FastAPI, Depends, HTTPException, Body, Path
 from fastapi_injector import Injected
+from starlette.responses import StreamingResponse
 from app.services import StationsService
+from app.services.stations.export import EXPORT_MEDIA_TYPES
 from app.utils.jwt_dependencies import jwt_required
-from app.models.api import StationsDataRequest
+from app.models.api import StationsDataRequest, StationsDataExportRequest, StationDataRollupsRequest
 
 def register(app: FastAPI):
 
@@ -14,60 +15,25 @@ def register(app: FastAPI):
         _ = Depends(jwt_required),
         stations = Injected(StationsService)
     ):
-        is_range_request = body.start_date is not None and body.end_date is not None
-        stations_data = await (
-            stations.get_stations_data_range(
-                body.start_date,
-                body.end_date,
-            ) if is_range_request
-            else stations.get_stations_data(body.last_seconds)
+        stations_data = await stations.get_stations_chart_data(
+            body.start_date,
+            body.end_date,
+            body.last_seconds,
+            body.records_count,
+            body.mode,
         )
 
-        def downsample_data(data, max_records):
-            if not max_records or len(data) <= max_records:
-                return data
-
-            result = [data[0]]
-            n_segments = max_records - 2
-            if n_segments <= 0:
-                return [data[0], data[-1]]
-
-            chunk_size = len(data) / n_segments
-            start_time = data[0].last_update_time
-            end_time = data[-1].last_update_time
-            total_duration = (end_time - start_time).total_seconds()
-
-            for i in range(n_segments):
-                start_idx = int(i * chunk_size)
-                end_idx = int((i + 1) * chunk_size)
-                chunk = data[start_idx:end_idx]
-                if not chunk:
-                    continue
-
-                avg_record = {
-                    "battery_soc": mean(d.battery_soc or 0 for d in chunk),
-                    "discharge_power": mean(d.discharge_power or 0 for d in chunk),
-                    "charge_power": mean(abs(d.charge_power) if d.charge_power else 0 for d in chunk),
-                    "consumption_power": mean(d.consumption_power or 0 for d in chunk),
-                    "last_update_time": start_time + timedelta(seconds=((i + 1) * total_duration / (n_segments + 1)))
-                }
-                result.append(avg_record)
-
-            result.append(data[-1])
-            return result
-
         def get_station_data(station, station_data):
-            station_data = downsample_data(station_data, body.records_count)
             return {
                 "id": str(station.id),
                 "name": station.station_name,
                 "data": [
                     {
-                        "batterySoc": d["battery_soc"] if isinstance(d, dict) else d.battery_soc,
-                        "dischargePower": d["discharge_power"] if isinstance(d, dict) else (d.discharge_power or 0),
-                        "chargePower": d["charge_power"] if isinstance(d, dict) else (abs(d.charge_power) if d.charge_power else 0),
-                        "consumptionPower": d["consumption_power"] if isinstance(d, dict) else (d.consumption_power or 0),
-                        "date": (d["last_update_time"] if isinstance(d, dict) else d.last_update_time).replace(tzinfo=timezone.utc).isoformat()
+                        "batterySoc": d["battery_soc"],
+                        "dischargePower": d["discharge_power"],
+                        "chargePower": d["charge_power"],
+                        "consumptionPower": d["consumption_power"],
+                        "date": d["last_update_time"].replace(tzinfo=timezone.utc).isoformat()
                     }
                     for d in station_data
                 ]
@@ -79,6 +45,60 @@ def register(app: FastAPI):
         ]
 
 
+    @app.post("/api/stationsData/export")
+    async def export_stations_data(
+        body: StationsDataExportRequest,
+        _ = Depends(jwt_required),
+        stations = Injected(StationsService)
+    ):
+        return StreamingResponse(
+            stations.export_stations_data(
+                body.station_ids,
+                body.start_date,
+                body.end_date,
+                body.last_seconds,
+                body.format,
+            ),
+            media_type=EXPORT_MEDIA_TYPES[body.format],
+            headers={
+                "Content-Disposition": f'attachment; filename="stations-data.{body.format.value}"',
+                "X-Accel-Buffering": "no",
+            },
+        )
+
+
+    @app.post("/api/stationsData/rollups")
+    async def get_station_data_rollups(
+        body: StationDataRollupsRequest,
+        _ = Depends(jwt_required),
+        stations = Injected(StationsService)
+    ):
+        rollups = await stations.get_rollups(
+            body.station_ids,
+            body.period,
+            body.start_date,
+            body.end_date,
+        )
+
+        return [
+            {
+                "stationId": str(rollup.station_id),
+                "period": rollup.period,
+                "startTime": rollup.start_time.replace(tzinfo=timezone.utc).isoformat(),
+                "samplesCount": rollup.samples_count,
+                "batterySocMin": rollup.battery_soc_min,
+                "batterySocAvg": rollup.battery_soc_avg,
+                "batterySocMax": rollup.battery_soc_max,
+                "consumptionKwh": rollup.consumption_kwh,
+                "generationKwh": rollup.generation_kwh,
+                "gridSeconds": rollup.grid_seconds,
+                "generatorSeconds": rollup.generator_seconds,
+                "batterySeconds": rollup.battery_seconds,
+            }
+            for rollup in rollups
+        ]
+
+
     @app.post("/api/stationsData/stationDetails/{station_id}")
     async def get_station_details(
         station_id: str = Path(..., description="Station ID"),
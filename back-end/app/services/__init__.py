@@ -13,9 +13,10 @@ from .stations import StationsService
 from .lookups import LookupsService
 from .chats import ChatsService
 from .ext_data import ExtDataService
+from .availability import AvailabilityService
 from .dashboard import DashboardService
 from .maintenance import MaintenanceService
-from .message_processor import MessageProcessorService
+from .message_processor import MessageProcessorService, PeriodicSendTrigger
 from .interfaces import IMessageGeneratorService, MessageItem
 
 
@@ -23,6 +24,6 @@ __all__ = [BeanieInitializer, BotsService, DeyeConfig, DeyeApiService,
            TelegramConfig, TelegramService, ServicesContainer,
            AuthorizationService, VisitCounterService, EventsService, EventItem,
            MessagesService, OutagesScheduleService, StationsService, LookupsService,
-           ChatsService, ExtDataService, DashboardService, UsersService,
+           ChatsService, ExtDataService, AvailabilityService, DashboardService, UsersService,
            MaintenanceService, IMessageGeneratorService, MessageItem,
-           MessageProcessorService, TranslationService]
+           MessageProcessorService, PeriodicSendTrigger, TranslationService]
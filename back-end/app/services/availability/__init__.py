@@ -0,0 +1,30 @@
+from .report import DailyOutageStatistics, OutageStatistics
+from .service import AvailabilityService
+from .strategies import (
+    AvailabilityCounter,
+    AvailabilityStrategy,
+    create_availability_strategy,
+)
+from .timeline import (
+    ReporterEvent,
+    Timeline,
+    TimelineBuilder,
+    TimelinePeriod,
+    iter_periods,
+    merge_reporter_events,
+)
+
+__all__ = [
+    AvailabilityService,
+    DailyOutageStatistics,
+    OutageStatistics,
+    AvailabilityCounter,
+    AvailabilityStrategy,
+    create_availability_strategy,
+    ReporterEvent,
+    Timeline,
+    TimelineBuilder,
+    TimelinePeriod,
+    iter_periods,
+    merge_reporter_events,
+]
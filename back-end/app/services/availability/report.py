@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Iterator, List
+
+from .timeline import TimelinePeriod
+
+
+@dataclass
+class OutageStatistics:
+    outages_count: int = 0
+    outage_seconds: float = 0.0
+    available_seconds: float = 0.0
+    longest_outage_seconds: float = 0.0
+
+    @property
+    def mean_time_between_outages_seconds(self) -> float | None:
+        return self.available_seconds / self.outages_count if self.outages_count else None
+
+    def add_available(self, seconds: float):
+        self.available_seconds += seconds
+
+    def add_outage(self, seconds: float, outage_seconds: float | None = None):
+        self.outage_seconds += seconds
+        if outage_seconds is not None:
+            self.outages_count += 1
+            self.longest_outage_seconds = max(self.longest_outage_seconds, outage_seconds)
+
+
+@dataclass
+class DailyOutageStatistics(OutageStatistics):
+    day: date | None = None
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+
+
+def merge_periods(periods: List[TimelinePeriod]) -> List[TimelinePeriod]:
+    merged: List[TimelinePeriod] = []
+    for period in periods:
+        last = merged[-1] if merged else None
+        if last and last.is_available == period.is_available and last.end_time >= period.start_time:
+            last.end_time = max(last.end_time, period.end_time)
+        else:
+            merged.append(TimelinePeriod(period.start_time, period.end_time, period.is_available))
+    return merged
+
+
+def _iter_days(start_date: datetime, end_date: datetime, tz: tzinfo) -> Iterator[DailyOutageStatistics]:
+    day = start_date.astimezone(tz).date()
+    while True:
+        day_start = datetime(day.year, day.month, day.day, tzinfo=tz).astimezone(timezone.utc)
+        if day_start >= end_date:
+            return
+        next_day = day + timedelta(days=1)
+        day_end = datetime(next_day.year, next_day.month, next_day.day, tzinfo=tz).astimezone(timezone.utc)
+        yield DailyOutageStatistics(
+            day        = day,
+            start_time = max(day_start, start_date),
+            end_time   = min(day_end, end_date),
+        )
+        day = next_day
+
+
+def get_outage_statistics(
+    periods: List[TimelinePeriod],
+    start_date: datetime,
+    end_date: datetime,
+    tz: tzinfo,
+) -> tuple[OutageStatistics, List[DailyOutageStatistics]]:
+    """Splits periods sorted by time and clipped to the range into per-day statistics.
+
+    An outage is counted once, on the day it starts; its minutes are spread over
+    every day it spans.
+    """
+    total = OutageStatistics()
+    days = list(_iter_days(start_date, end_date, tz))
+    first_day = 0
+
+    for period in merge_periods(periods):
+        if period.is_available:
+            total.add_available(period.duration_seconds)
+        else:
+            total.add_outage(period.duration_seconds, period.duration_seconds)
+
+        while first_day < len(days) and days[first_day].end_time <= period.start_time:
+            first_day += 1
+
+        index = first_day
+        while index < len(days) and days[index].start_time < period.end_time:
+            stats = days[index]
+            seconds = (min(stats.end_time, period.end_time) - max(stats.start_time, period.start_time)).total_seconds()
+            if period.is_available:
+                stats.add_available(seconds)
+            else:
+                stats.add_outage(seconds, period.duration_seconds if index == first_day else None)
+            index += 1
+
+    return total, days
@@ -0,0 +1,297 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from beanie import PydanticObjectId
+from injector import inject
+
+from app.repositories import IAvailabilityRepository, IDashboardRepository, IExtDataRepository
+from app.settings import Settings
+from shared.models import AvailabilityPeriod, Building
+from .report import DailyOutageStatistics, OutageStatistics, get_outage_statistics
+from .strategies import AvailabilityCounter, AvailabilityStrategy
+from .timeline import Timeline, TimelineBuilder, TimelinePeriod, as_utc, iter_periods, merge_reporter_events
+
+
+logger = logging.getLogger(__name__)
+
+
+def _get_seconds_before(period: AvailabilityPeriod, date: datetime) -> tuple[float, float]:
+    elapsed = max((date - as_utc(period.start_time)).total_seconds(), 0)
+    if period.is_available:
+        return period.available_seconds_before + elapsed, period.unavailable_seconds_before
+    return period.available_seconds_before, period.unavailable_seconds_before + elapsed
+
+
+def _clip_period(period: AvailabilityPeriod, start_date: datetime, end_date: datetime) -> TimelinePeriod:
+    start_time = max(as_utc(period.start_time), start_date)
+    # an open period only lasts until now, whatever end_date was requested
+    end_time = as_utc(period.end_time) if period.end_time else datetime.now(timezone.utc)
+    return TimelinePeriod(start_time, max(min(end_time, end_date), start_time), period.is_available)
+
+
+@inject
+class AvailabilityService:
+    def __init__(
+        self,
+        settings: Settings,
+        availability: IAvailabilityRepository,
+        dashboard: IDashboardRepository,
+        ext_data: IExtDataRepository,
+        strategy: AvailabilityStrategy,
+    ):
+        self._settings = settings
+        self._availability = availability
+        self._dashboard = dashboard
+        self._ext_data = ext_data
+        self._strategy = strategy
+        self._lock = asyncio.Lock()
+
+
+    def _get_retention_start(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(days=self._settings.STATISTIC_KEEP_DAYS)
+
+
+    def _get_report_timezone(self) -> ZoneInfo:
+        try:
+            return ZoneInfo(self._settings.BOT_TIMEZONE)
+        except ZoneInfoNotFoundError:
+            logger.warning(f'Cannot get timezone {self._settings.BOT_TIMEZONE}, falling back to UTC')
+            return ZoneInfo('UTC')
+
+
+    async def init(self):
+        buildings = await self._dashboard.get_buildings(all=True)
+        for building in buildings:
+            open_period = await self._availability.get_open_period(building.id)
+            # after a strategy change only the range raw data still covers is rebuilt;
+            # older periods can't be replayed and keep the strategy they were built with
+            if open_period and open_period.strategy != self._strategy.key:
+                open_period = None
+            await self.rebuild(building, as_utc(open_period.start_time) if open_period else None)
+        logger.info(f"availability timeline initialized for {len(buildings)} buildings")
+
+
+    async def rebuild(self, building: Building, since: datetime | None = None):
+        retention_start = self._get_retention_start()
+        since = max(since, retention_start) if since else retention_start
+        async with self._lock:
+            await self._rebuild(building, since, retention_start)
+
+
+    async def _rebuild(self, building: Building, since: datetime, retention_start: datetime):
+        spanning = await self._availability.get_period_at(building.id, since)
+        if spanning and as_utc(spanning.start_time) >= retention_start:
+            since = as_utc(spanning.start_time)
+            spanning = None
+
+        previous = spanning or await self._availability.get_last_period_before(building.id, since)
+        await self._availability.delete_periods_from(building.id, since)
+
+        available_before, unavailable_before = 0.0, 0.0
+        if previous:
+            if previous.end_time is None or as_utc(previous.end_time) > since:
+                previous.end_time = since
+                await self._availability.save_period(previous)
+            available_before, unavailable_before = _get_seconds_before(previous, as_utc(previous.end_time))
+
+        report_users = building.report_users or []
+        if not report_users:
+            return
+
+        now = datetime.now(timezone.utc)
+        last_before_by_user = await asyncio.gather(
+            *(self._ext_data.get_last_ext_data_before_date(user.id, since) for user in report_users)
+        )
+
+        # ext_data older than the retention window is purged, so reporters without
+        # a known state before since fall back to the states stored on previous,
+        # which holds the reporter states as of its end.
+        stored_states = previous.reporter_states if previous else {}
+        reporter_states = [
+            last.grid_state if last else stored_states.get(str(user.id), False)
+            for user, last in zip(report_users, last_before_by_user)
+        ]
+        last_event_time = since
+
+        async def track_events():
+            nonlocal last_event_time
+            async for event in merge_reporter_events([
+                self._ext_data.iter_grid_states(user.id, since, now) for user in report_users
+            ]):
+                last_event_time = event.received_at
+                yield event
+
+        periods: List[AvailabilityPeriod] = []
+        async for period in iter_periods(since, now, self._strategy, reporter_states, track_events()):
+            periods.append(AvailabilityPeriod(
+                building_id                = building.id,
+                start_time                 = period.start_time,
+                end_time                   = period.end_time,
+                is_available               = period.is_available,
+                available_seconds_before   = available_before,
+                unavailable_seconds_before = unavailable_before,
+                reporter_states            = {
+                    str(user.id): state for user, state in zip(report_users, reporter_states)
+                },
+            ))
+            if period.is_available:
+                available_before += period.duration_seconds
+            else:
+                unavailable_before += period.duration_seconds
+
+        if periods:
+            periods[-1].end_time = None
+            periods[-1].strategy = self._strategy.key
+            periods[-1].available_weight = AvailabilityCounter(self._strategy, reporter_states).available_weight
+            periods[-1].last_event_time = last_event_time
+        await self._availability.insert_periods(periods)
+
+
+    async def apply_report(self, user_id: PydanticObjectId, grid_state: bool, date: datetime):
+        date = as_utc(date)
+        buildings = await self._dashboard.get_buildings_by_report_user(user_id)
+        for building in buildings:
+            async with self._lock:
+                open_period = await self._availability.get_open_period(building.id)
+                last_event_time = as_utc(open_period.last_event_time or open_period.start_time) if open_period else None
+                if open_period is None or date < last_event_time:
+                    await self._rebuild(building, date, self._get_retention_start())
+                    continue
+
+                reporter_ids = list(open_period.reporter_states)
+                states = list(open_period.reporter_states.values())
+                if str(user_id) not in open_period.reporter_states:
+                    reporter_ids.append(str(user_id))
+                    states.append(False)
+                counter = AvailabilityCounter(self._strategy, states, open_period.available_weight)
+                counter.set(reporter_ids.index(str(user_id)), grid_state)
+                reporter_states = dict(zip(reporter_ids, states))
+                available_weight = counter.available_weight
+                is_available = counter.is_available
+
+                if is_available == open_period.is_available or date == as_utc(open_period.start_time):
+                    open_period.is_available = is_available
+                    open_period.reporter_states = reporter_states
+                    open_period.available_weight = available_weight
+                    open_period.last_event_time = date
+                    await self._availability.save_period(open_period)
+                    continue
+
+                open_period.end_time = date
+                await self._availability.save_period(open_period)
+
+                available_before, unavailable_before = _get_seconds_before(open_period, date)
+                await self._availability.insert_periods([AvailabilityPeriod(
+                    building_id                = building.id,
+                    start_time                 = date,
+                    is_available               = is_available,
+                    available_seconds_before   = available_before,
+                    unavailable_seconds_before = unavailable_before,
+                    reporter_states            = reporter_states,
+                    available_weight           = available_weight,
+                    last_event_time            = date,
+                    strategy                   = self._strategy.key,
+                )])
+
+
+    async def rebuild_for_user(self, user_id: PydanticObjectId, since: datetime | None = None):
+        for building in await self._dashboard.get_buildings_by_report_user(user_id):
+            await self.rebuild(building, since)
+
+
+    async def delete_building(self, building_id: PydanticObjectId):
+        async with self._lock:
+            await self._availability.delete_building_periods(building_id)
+
+
+    async def get_timelines(
+        self,
+        building_ids: List[PydanticObjectId],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Dict[PydanticObjectId, Timeline]:
+        """Reads stored timelines; buildings whose timeline starts after start_date are left out."""
+        periods_by_building: Dict[PydanticObjectId, List[AvailabilityPeriod]] = {}
+        for period in await self._availability.get_periods(building_ids, start_date, end_date):
+            periods_by_building.setdefault(period.building_id, []).append(period)
+
+        timelines = {}
+        for building_id, periods in periods_by_building.items():
+            first, last = periods[0], periods[-1]
+            if as_utc(first.start_time) > start_date:
+                continue
+
+            clipped = [_clip_period(period, start_date, end_date) for period in periods]
+            available_start, unavailable_start = _get_seconds_before(first, start_date)
+            available_end, unavailable_end = _get_seconds_before(last, clipped[-1].end_time)
+            timelines[building_id] = Timeline(
+                periods             = clipped,
+                available_seconds   = available_end - available_start,
+                unavailable_seconds = unavailable_end - unavailable_start,
+            )
+        return timelines
+
+
+    async def replay_timelines(
+        self,
+        buildings: List[Building],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Dict[PydanticObjectId, Timeline]:
+        """Replays raw ext_data once for the union of report users of all buildings."""
+        user_ids = list(dict.fromkeys(user.id for building in buildings for user in building.report_users or []))
+        user_indexes = {user_id: i for i, user_id in enumerate(user_ids)}
+
+        last_before_by_user = await asyncio.gather(
+            *(self._ext_data.get_last_ext_data_before_date(user_id, start_date) for user_id in user_ids)
+        )
+        user_states = [last.grid_state if last else False for last in last_before_by_user]
+
+        timelines: Dict[PydanticObjectId, Timeline] = {}
+        builders: Dict[PydanticObjectId, TimelineBuilder] = {}
+        subscribers: List[List[tuple[TimelineBuilder, Timeline, int]]] = [[] for _ in user_ids]
+        for building in buildings:
+            report_users = building.report_users or []
+            timeline = timelines[building.id] = Timeline()
+            builder = builders[building.id] = TimelineBuilder(
+                start_date,
+                self._strategy,
+                [user_states[user_indexes[user.id]] for user in report_users],
+            )
+            for reporter_index, user in enumerate(report_users):
+                subscribers[user_indexes[user.id]].append((builder, timeline, reporter_index))
+
+        events = merge_reporter_events([
+            self._ext_data.iter_grid_states(user_id, start_date, end_date) for user_id in user_ids
+        ])
+        async for event_time, user_index, grid_state in events:
+            for builder, timeline, reporter_index in subscribers[user_index]:
+                period = builder.apply(event_time, reporter_index, grid_state)
+                if period:
+                    timeline.append(period)
+
+        for building_id, builder in builders.items():
+            period = builder.close(end_date)
+            if period:
+                timelines[building_id].append(period)
+        return timelines
+
+
+    async def get_outage_statistics(
+        self,
+        building_ids: List[PydanticObjectId],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Dict[PydanticObjectId, tuple[OutageStatistics, List[DailyOutageStatistics]]]:
+        """Builds outage statistics from stored periods; ranges not covered by the timeline count as neither state."""
+        periods_by_building: Dict[PydanticObjectId, List[TimelinePeriod]] = {id: [] for id in building_ids}
+        for period in await self._availability.get_periods(building_ids, start_date, end_date):
+            periods_by_building[period.building_id].append(_clip_period(period, start_date, end_date))
+
+        tz = self._get_report_timezone()
+        return {
+            building_id: get_outage_statistics(periods, start_date, end_date, tz)
+            for building_id, periods in periods_by_building.items()
+        }
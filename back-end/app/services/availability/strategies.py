@@ -0,0 +1,100 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from app.models import AvailabilityStrategyType
+from app.settings import Settings
+
+
+class AvailabilityStrategy(ABC):
+    """Decides whether the grid is available from the number of reporters that see it."""
+
+    @property
+    @abstractmethod
+    def key(self) -> str:
+        ...
+
+    @abstractmethod
+    def is_available(self, available_weight: float, total_weight: float) -> bool:
+        ...
+
+
+class AnyStrategy(AvailabilityStrategy):
+    key = AvailabilityStrategyType.ANY.value
+
+    def is_available(self, available_weight: float, total_weight: float) -> bool:
+        return available_weight > 0
+
+
+class AllStrategy(AvailabilityStrategy):
+    key = AvailabilityStrategyType.ALL.value
+
+    def is_available(self, available_weight: float, total_weight: float) -> bool:
+        return total_weight > 0 and available_weight >= total_weight
+
+
+class MajorityStrategy(AvailabilityStrategy):
+    key = AvailabilityStrategyType.MAJORITY.value
+
+    def is_available(self, available_weight: float, total_weight: float) -> bool:
+        return available_weight * 2 > total_weight
+
+
+class QuorumStrategy(AvailabilityStrategy):
+    def __init__(self, quorum: float):
+        self._quorum = quorum
+
+    @property
+    def key(self) -> str:
+        return f"{AvailabilityStrategyType.QUORUM.value}:{self._quorum:g}"
+
+    def is_available(self, available_weight: float, total_weight: float) -> bool:
+        return total_weight > 0 and available_weight >= self._quorum * total_weight
+
+
+def create_availability_strategy(settings: Settings) -> AvailabilityStrategy:
+    strategy_type = AvailabilityStrategyType(settings.AVAILABILITY_STRATEGY)
+    if strategy_type == AvailabilityStrategyType.ALL:
+        return AllStrategy()
+    if strategy_type == AvailabilityStrategyType.MAJORITY:
+        return MajorityStrategy()
+    if strategy_type == AvailabilityStrategyType.QUORUM:
+        return QuorumStrategy(settings.AVAILABILITY_QUORUM)
+    return AnyStrategy()
+
+
+class AvailabilityCounter:
+    """Keeps the number of available reporters of a building up to date in O(1) per change.
+
+    Every reporter weighs 1. states is updated in place, so callers can read the
+    final reporter states back; available_weight restores a count kept elsewhere.
+    """
+    __slots__ = ("strategy", "states", "available_weight", "total_weight")
+
+    def __init__(
+        self,
+        strategy: AvailabilityStrategy,
+        states: List[bool],
+        available_weight: float | None = None,
+    ):
+        self.strategy = strategy
+        self.states = states
+        self.total_weight = float(len(states))
+        self.available_weight = float(sum(states)) if available_weight is None else available_weight
+
+    def set(self, index: int, state: bool):
+        if self.states[index] == state:
+            return
+        self.states[index] = state
+        self.available_weight += 1.0 if state else -1.0
+
+    @property
+    def is_available(self) -> bool:
+        return self.strategy.is_available(self.available_weight, self.total_weight)
+
+    @property
+    def available_ratio(self) -> float:
+        return self.available_weight / self.total_weight if self.total_weight else 0.0
+
+    @property
+    def is_mixed(self) -> bool:
+        return 0 < self.available_weight < self.total_weight
@@ -0,0 +1,124 @@
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import AsyncGenerator, AsyncIterable, AsyncIterator, List, NamedTuple, Sequence
+
+from .strategies import AvailabilityCounter, AvailabilityStrategy
+
+
+def as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass
+class TimelinePeriod:
+    start_time: datetime
+    end_time: datetime
+    is_available: bool
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.end_time - self.start_time).total_seconds()
+
+
+@dataclass
+class Timeline:
+    periods: List[TimelinePeriod] = field(default_factory=list)
+    available_seconds: float = 0.0
+    unavailable_seconds: float = 0.0
+
+    def append(self, period: TimelinePeriod):
+        self.periods.append(period)
+        if period.is_available:
+            self.available_seconds += period.duration_seconds
+        else:
+            self.unavailable_seconds += period.duration_seconds
+
+
+class TimelineBuilder:
+    """Aggregate state machine over the reporters of one building.
+
+    reporter_states holds the state of every reporter at start_date and is
+    updated in place as events are applied.
+    """
+    __slots__ = ("counter", "current_time", "current_state")
+
+    def __init__(self, start_date: datetime, strategy: AvailabilityStrategy, reporter_states: List[bool]):
+        self.counter = AvailabilityCounter(strategy, reporter_states)
+        self.current_time = start_date
+        self.current_state = self.counter.is_available
+
+    def apply(self, event_time: datetime, reporter_index: int, grid_state: bool) -> TimelinePeriod | None:
+        self.counter.set(reporter_index, grid_state)
+        new_state = self.counter.is_available
+        if new_state == self.current_state:
+            return None
+
+        period = None
+        if event_time > self.current_time:
+            period = TimelinePeriod(self.current_time, event_time, self.current_state)
+            self.current_time = event_time
+        self.current_state = new_state
+        return period
+
+    def close(self, end_date: datetime) -> TimelinePeriod | None:
+        if self.current_time < end_date:
+            return TimelinePeriod(self.current_time, end_date, self.current_state)
+        return None
+
+
+class ReporterEvent(NamedTuple):
+    received_at: datetime
+    reporter_index: int
+    grid_state: bool
+
+
+async def merge_reporter_events(
+    streams: Sequence[AsyncGenerator[tuple[datetime, bool], None]],
+) -> AsyncIterator[ReporterEvent]:
+    """K-way merge of per-reporter (received_at, grid_state) streams.
+
+    Every stream must already be sorted by received_at; the heap holds one
+    pending event per reporter, ties are broken by reporter index.
+    """
+    heap: List[ReporterEvent] = []
+    try:
+        for index, stream in enumerate(streams):
+            item = await anext(stream, None)
+            if item is not None:
+                heap.append(ReporterEvent(as_utc(item[0]), index, item[1]))
+        heapq.heapify(heap)
+
+        while heap:
+            event = heap[0]
+            yield event
+            item = await anext(streams[event.reporter_index], None)
+            if item is not None:
+                heapq.heapreplace(heap, ReporterEvent(as_utc(item[0]), event.reporter_index, item[1]))
+            else:
+                heapq.heappop(heap)
+    finally:
+        for stream in streams:
+            await stream.aclose()
+
+
+async def iter_periods(
+    start_date: datetime,
+    end_date: datetime,
+    strategy: AvailabilityStrategy,
+    reporter_states: List[bool],
+    events: AsyncIterable[ReporterEvent],
+) -> AsyncIterator[TimelinePeriod]:
+    """Replays reporter events sorted by time, yielding closed periods as soon as they end."""
+    builder = TimelineBuilder(start_date, strategy, reporter_states)
+
+    async for event_time, reporter_index, grid_state in events:
+        period = builder.apply(event_time, reporter_index, grid_state)
+        if period:
+            yield period
+
+    period = builder.close(end_date)
+    if period:
+        yield period
@@ -11,14 +11,15 @@ from .telegram import TelegramConfig, TelegramService
 from .deye_api import DeyeConfig, DeyeApiService
 from .visit_counter import VisitCounterService
 from .users import UsersService
-from .stations import StationsService
+from .stations import StationsService, StationsSyncConfig
 from .messages import MessagesService
 from .lookups import LookupsService
 from .ext_data import ExtDataService
-from .dashboard import DashboardService
+from .availability import AvailabilityService, AvailabilityStrategy, create_availability_strategy
+from .dashboard import DashboardService, DashboardSnapshot
 from .maintenance import MaintenanceService
 from .message_generator import MessageGeneratorService, MessageGeneratorConfig
-from .message_processor import MessageProcessorService
+from .message_processor import MessageProcessorConfig, MessageProcessorService, PeriodicSendTrigger
 from .interfaces import IMessageGeneratorService
 
 
@@ -38,6 +39,7 @@ class ServicesContainer(Module):
         binder.bind(DeyeConfig, scope=noscope)
         binder.bind(DeyeApiService, scope=singleton)
 
+        binder.bind(StationsSyncConfig, scope=noscope)
         binder.bind(StationsService, scope=noscope)
 
         events_service_config = EventsServiceConfig(str(self._settings.REDIS_URI), self._settings.DEBUG)
@@ -54,7 +56,9 @@ class ServicesContainer(Module):
         binder.bind(MessageGeneratorConfig, scope=noscope)
         binder.bind(IMessageGeneratorService, to=MessageGeneratorService, scope=noscope)
 
+        binder.bind(MessageProcessorConfig, scope=noscope)
         binder.bind(MessageProcessorService, scope=noscope)
+        binder.bind(PeriodicSendTrigger, scope=singleton)
 
         binder.bind(VisitCounterService, scope=noscope)
 
@@ -62,8 +66,11 @@ class ServicesContainer(Module):
         binder.bind(MessagesService, scope=noscope)
         binder.bind(LookupsService, scope=noscope)
 
+        binder.bind(AvailabilityStrategy, to=create_availability_strategy(self._settings), scope=singleton)
+        binder.bind(AvailabilityService, scope=singleton)
         binder.bind(ExtDataService, scope=noscope)
 
+        binder.bind(DashboardSnapshot, scope=singleton)
         binder.bind(DashboardService, scope=noscope)
 
         scheduler = AsyncIOScheduler()
@@ -1,3 +1,4 @@
 from .service import DashboardService
+from .snapshot import DashboardSnapshot, SnapshotEntry
 
-__all__ = [DashboardService]
\ No newline at end of file
+__all__ = [DashboardService, DashboardSnapshot, SnapshotEntry]
\ No newline at end of file
@@ -1,14 +1,17 @@
 import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import Dict, List
 from beanie import PydanticObjectId
 from injector import inject
 
 from shared.models.building import Building
 from shared.models.dashboard_config import DashboardConfig
 from shared.models.ext_data import ExtData
+from shared.models.station_data import StationData
 from shared.services.events.service import EventsService
 from ..base import BaseService
+from ..availability import AvailabilityCounter, AvailabilityService, AvailabilityStrategy, OutageStatistics, Timeline
+from .snapshot import DashboardSnapshot, SnapshotEntry
 from app.repositories import (
     IDashboardRepository,
     IExtDataRepository,
@@ -16,14 +19,18 @@ from app.repositories import (
     IStationsDataRepository,
     IUsersRepository,
 )
-from app.models import AssumedStationStatus
+from app.models import AssumedStationStatus, ChargeDurations
 from app.models.api import (
     BuildingResponse,
     BuildingSummaryResponse,
     BuildingWithSummaryResponse,
+    BuildingOutagesReportResponse,
+    BuildingPowerLogsResponse,
     ChargeSource,
+    DailyOutagesStatisticsResponse,
     DashboardConfigResponse,
     EditBuildingResponse,
+    OutagesStatisticsResponse,
     PeriodResponse,
     PowerLogsResponse,
     SaveBuildingRequest,
@@ -42,6 +49,9 @@ class DashboardService(BaseService):
         stations: IStationsRepository,
         stations_data: IStationsDataRepository,
         users: IUsersRepository,
+        snapshot: DashboardSnapshot,
+        availability: AvailabilityService,
+        strategy: AvailabilityStrategy,
     ):
         super().__init__(events)
         self._dashboard = dashboard
@@ -49,6 +59,9 @@ class DashboardService(BaseService):
         self._stations = stations
         self._stations_data = stations_data
         self._users = users
+        self._snapshot = snapshot
+        self._availability = availability
+        self._strategy = strategy
 
 
     async def get_config(self) -> DashboardConfigResponse:
@@ -110,6 +123,7 @@ class DashboardService(BaseService):
             building.enabled = request.enabled
 
             await self._dashboard.edit_building(building)
+            await self._availability.rebuild(building)
             await self.broadcast_public("buildings_updated")
             return building_id
 
@@ -131,6 +145,7 @@ class DashboardService(BaseService):
         )
 
         building_id = await self._dashboard.create_building(building)
+        await self._availability.rebuild(building)
         await self.broadcast_public("buildings_updated")
         return building_id
 
@@ -139,54 +154,57 @@ class DashboardService(BaseService):
         building = await self._dashboard.get_building(building_id)
         if building:
             await self._dashboard.delete_building(building)
+            await self._availability.delete_building(building_id)
             await self.broadcast_public("buildings_updated")
             return True
         return False
 
 
-    async def get_buildings(self, all: bool = False) -> List[BuildingResponse]:
-        buildings = await self._dashboard.get_buildings(all=all)
-        return [self._process_building(building) for building in buildings]
+    async def get_buildings(self, all: bool = False) -> SnapshotEntry:
+        async def build() -> List[BuildingResponse]:
+            buildings = await self._dashboard.get_buildings(all=all)
+            return [self._process_building(building) for building in buildings]
 
+        return await self._snapshot.get(f"buildings:{'all' if all else 'enabled'}", build)
 
-    async def _process_building_summary(self, building: Building, minutes) -> BuildingSummaryResponse:
+
+    def _process_building_summary(
+        self,
+        building: Building,
+        last_ext_data: Dict[PydanticObjectId, ExtData],
+        last_station_data: Dict[PydanticObjectId, StationData],
+        average_consumption: Dict[PydanticObjectId, float],
+    ) -> BuildingSummaryResponse:
         result = BuildingSummaryResponse(
             id    = building.id
         )
 
-        ext_datas: List[ExtData] = await asyncio.gather(
-            *(self._ext_data.get_last_ext_data_by_user_id(report_user.id)
-                for report_user in building.report_users)
-        )
+        ext_datas: List[ExtData] = [
+            last_ext_data.get(report_user.id)
+            for report_user in building.report_users
+        ]
         if ext_datas and len(ext_datas) > 0:
-            result.is_grid_available = any(x and x.grid_state for x in ext_datas)
-            true_count = sum(x.grid_state for x in ext_datas if x)
-            result.grid_availability_pct = int((true_count / len(ext_datas)) * 100)
-            result.has_mixed_reporter_states = (
-                true_count > 0 and true_count < len(ext_datas)
-            )
+            counter = AvailabilityCounter(self._strategy, [bool(x and x.grid_state) for x in ext_datas])
+            result.is_grid_available = counter.is_available
+            result.grid_availability_pct = int(counter.available_ratio * 100)
+            result.has_mixed_reporter_states = counter.is_mixed
 
         if building.station:
             station_id = building.station.id
-            station_data = await self._stations_data.get_last_station_data(station_id)
+            station_data = last_station_data.get(station_id)
             if station_data is None:
                 return result
 
             is_discharging = (station_data.discharge_power or 0) > 200
             is_charging = (station_data.charge_power or 0) * -1 > 200
 
-            assumed_offline = await self._stations_data.get_assumed_connection_status(station_id) == AssumedStationStatus.OFFLINE
+            assumed_offline = self._stations_data.get_assumed_status(station_data) == AssumedStationStatus.OFFLINE
             result.is_offline = building.station.connection_status == 'ALL_OFFLINE' or assumed_offline
             result.is_charging = is_charging
             result.is_discharging = is_discharging
             result.battery_percent = station_data.battery_soc
 
-            average_consumption_w = await self._stations_data.get_station_data_average_column(
-                datetime.now(timezone.utc) - timedelta(minutes=minutes),
-                datetime.now(timezone.utc),
-                station_id,
-                "consumption_power",
-            ) or 0
+            average_consumption_w = average_consumption.get(station_id) or 0
 
             result.consumption_power = f"{(average_consumption_w / 1000):.2f}"
 
@@ -218,21 +236,60 @@ class DashboardService(BaseService):
         return result
 
 
-    async def get_buildings_summary(self, building_ids: List[PydanticObjectId]) -> List[BuildingSummaryResponse]:
-        buildings = await self._dashboard.get_buildings(building_ids)
-        minutes = 25
-
-        return await asyncio.gather(
-            *(self._process_building_summary(b, minutes) for b in buildings)
+    async def _process_buildings_summary(self, buildings: List[Building], minutes) -> List[BuildingSummaryResponse]:
+        user_ids = list({
+            report_user.id
+            for building in buildings
+            for report_user in building.report_users
+        })
+        station_ids = list({
+            building.station.id
+            for building in buildings
+            if building.station
+        })
+
+        end_date = datetime.now(timezone.utc)
+        last_ext_data, last_station_data, average_consumption = await asyncio.gather(
+            self._ext_data.get_last_ext_data_by_user_ids(user_ids),
+            self._stations_data.get_last_stations_data(station_ids),
+            self._stations_data.get_stations_data_average_column(
+                end_date - timedelta(minutes=minutes),
+                end_date,
+                station_ids,
+                "consumption_power",
+            ),
         )
 
+        return [
+            self._process_building_summary(b, last_ext_data, last_station_data, average_consumption)
+            for b in buildings
+        ]
+
+
+    async def get_buildings_summary(self, building_ids: List[PydanticObjectId]) -> SnapshotEntry:
+        async def build() -> List[BuildingSummaryResponse]:
+            buildings = await self._dashboard.get_buildings(all=True)
+            minutes = 25
 
-    async def get_buildings_with_summary(self) -> List[BuildingWithSummaryResponse]:
+            return await self._process_buildings_summary(buildings, minutes)
+
+        # One snapshot for every building, filtered per request, so arbitrary
+        # id lists from the public endpoint can't grow the snapshot keys.
+        entry = await self._snapshot.get("buildings_summary", build)
+        ids = set(building_ids)
+        return SnapshotEntry([summary for summary in entry.value if summary.id in ids], entry.version)
+
+
+    async def get_buildings_with_summary(self) -> SnapshotEntry:
+        return await self._snapshot.get("buildings_with_summary", self._build_buildings_with_summary)
+
+
+    async def _build_buildings_with_summary(self) -> List[BuildingWithSummaryResponse]:
         buildings = await self._dashboard.get_buildings()
         minutes = 25
+        summaries = await self._process_buildings_summary(buildings, minutes)
 
-        async def process_building(building: Building) -> BuildingWithSummaryResponse:
-            res = await self._process_building_summary(building, minutes)
+        def process_building(building: Building, res: BuildingSummaryResponse) -> BuildingWithSummaryResponse:
 
             return BuildingWithSummaryResponse(
                 **res.model_dump(),
@@ -240,32 +297,79 @@ class DashboardService(BaseService):
                 color = building.color,
             )
 
-        return [await process_building(b) for b in buildings]
+        return [process_building(b, res) for b, res in zip(buildings, summaries)]
 
 
-    async def _compute_total_generator_time(
+    def _process_power_logs(
         self,
-        station_id: str,
+        building: Building,
+        timeline: Timeline,
+        charge_durations: ChargeDurations,
+    ) -> BuildingPowerLogsResponse:
+        periods = [
+            PeriodResponse(
+                start_time       = period.start_time.isoformat(),
+                end_time         = period.end_time.isoformat(),
+                is_available     = period.is_available,
+                duration_seconds = int(period.duration_seconds)
+            )
+            for period in timeline.periods
+        ]
+
+        total_seconds = int(timeline.available_seconds + timeline.unavailable_seconds)
+
+        return BuildingPowerLogsResponse(
+            id                          = building.id,
+            periods                     = periods,
+            total_available_seconds     = int(timeline.available_seconds),
+            total_unavailable_seconds   = int(timeline.unavailable_seconds),
+            total_generator_seconds     = int(charge_durations.generator_seconds),
+            total_grid_charging_seconds = int(charge_durations.grid_seconds),
+            total_recuperation_seconds  = int(charge_durations.recuperation_seconds),
+            total_seconds               = total_seconds,
+        )
+
+
+    async def get_buildings_power_logs(
+        self,
+        building_ids: List[PydanticObjectId],
         start_date: datetime,
         end_date: datetime,
-    ) -> int:
-        data = await self._stations_data.get_full_station_data_range(
-            station_id,
+    ) -> List[BuildingPowerLogsResponse]:
+        buildings = [
+            building
+            for building in await self._dashboard.get_buildings(building_ids)
+            if building.report_users
+        ]
+        if not buildings:
+            return []
+
+        timelines = await self._availability.get_timelines(
+            [building.id for building in buildings],
             start_date,
-            end_date,
+            end_date
         )
-        if data and len(data) > 1:
-            total_seconds = 0
-            for i in range(1, len(data)):
-                prev = data[i - 1]
-                curr = data[i]
-
-                if (prev.charge_power or 0) * -1 > 200 and (prev.generation_power or 0) > 0 and (prev.wire_power or 0) == 0:
-                    delta = (curr.last_update_time - prev.last_update_time).total_seconds()
-                    total_seconds += delta
-
-            return total_seconds
-        return 0
+        missing = [building for building in buildings if building.id not in timelines]
+        if missing:
+            timelines.update(await self._availability.replay_timelines(missing, start_date, end_date))
+
+        with_station = [building for building in buildings if building.station]
+        charge_durations = dict(zip(
+            (building.id for building in with_station),
+            await asyncio.gather(*(
+                self._stations_data.get_charge_durations(building.station.id, start_date, end_date)
+                for building in with_station
+            )),
+        ))
+
+        return [
+            self._process_power_logs(
+                building,
+                timelines[building.id],
+                charge_durations.get(building.id) or ChargeDurations(),
+            )
+            for building in buildings
+        ]
 
 
     async def get_power_logs(
@@ -274,128 +378,47 @@ class DashboardService(BaseService):
         start_date: datetime,
         end_date: datetime,
     ) -> PowerLogsResponse:
-        building = await self._dashboard.get_building(building_id)
-        if not building:
-            return None
-
-        if not building.report_users or len(building.report_users) == 0:
-            return None
-
-        all_records_by_user = await asyncio.gather(
-            *(self._ext_data.get_ext_data_statistics(report_user.id, start_date, end_date)
-              for report_user in building.report_users)
+        power_logs = await self.get_buildings_power_logs([building_id], start_date, end_date)
+        return power_logs[0] if power_logs else None
+
+
+    def _process_outage_statistics(self, stats: OutageStatistics) -> dict:
+        mtbo = stats.mean_time_between_outages_seconds
+        return dict(
+            outages_count                     = stats.outages_count,
+            outage_minutes                    = round(stats.outage_seconds / 60, 1),
+            available_minutes                 = round(stats.available_seconds / 60, 1),
+            longest_outage_minutes            = round(stats.longest_outage_seconds / 60, 1),
+            mean_time_between_outages_minutes = round(mtbo / 60, 1) if mtbo is not None else None,
         )
 
-        last_before_by_user = await asyncio.gather(
-            *(self._ext_data.get_last_ext_data_before_date(report_user.id, start_date)
-              for report_user in building.report_users)
-        )
 
-        total_generator_seconds = await self._compute_total_generator_time(
-            building.station.id,
+    async def get_outages_report(
+        self,
+        building_ids: List[PydanticObjectId] | None,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[BuildingOutagesReportResponse]:
+        start_date = start_date.replace(tzinfo=timezone.utc) if start_date.tzinfo is None else start_date
+        end_date = end_date.replace(tzinfo=timezone.utc) if end_date.tzinfo is None else end_date
+
+        buildings = await self._dashboard.get_buildings(building_ids)
+        statistics = await self._availability.get_outage_statistics(
+            [building.id for building in buildings],
             start_date,
             end_date
-        ) if building.station else 0
-
-        all_events = []
-
-        for user_idx, records in enumerate(all_records_by_user):
-            if records:
-                for record in records:
-                    all_events.append({
-                        'timestamp': record.received_at.replace(tzinfo=timezone.utc) if record.received_at.tzinfo is None else record.received_at,
-                        'user_idx': user_idx,
-                        'grid_state': record.grid_state
-                    })
-
-        if not all_events:
-            initial_state = any(last and last.grid_state for last in last_before_by_user if last)
-            duration_seconds = (end_date - start_date).total_seconds()
-
-            return PowerLogsResponse(
-                periods = [PeriodResponse(
-                    start_time       = start_date.isoformat(),
-                    end_time         = end_date.isoformat(),
-                    is_available     = initial_state,
-                    duration_seconds = int(duration_seconds)
-                )],
-                total_available_seconds   = int(duration_seconds) if initial_state else 0,
-                total_unavailable_seconds = int(duration_seconds) if not initial_state else 0,
-                total_generator_seconds   = int(total_generator_seconds),
-                total_seconds             = int(duration_seconds)
-            )
-
-        all_events.sort(key=lambda e: e['timestamp'])
-
-        reporter_states = [
-            (last.grid_state if last else False) 
-            for last in last_before_by_user
-        ]
+        )
 
-        if all_events[0]['timestamp'] > start_date:
-            initial_aggregate_state = any(reporter_states)
-            all_events.insert(0, {
-                'timestamp': start_date,
-                'user_idx': -1, 
-                'grid_state': initial_aggregate_state,
-                'is_synthetic': True
-            })
-
-        periods = []
-        total_available_seconds = 0
-        total_unavailable_seconds = 0
-
-        current_time = start_date
-        current_aggregate_state = any(reporter_states)  # OR logic (pessimistic strategy)
-
-        for event in all_events:
-            event_time = event['timestamp']
-
-            if event['user_idx'] >= 0:
-                reporter_states[event['user_idx']] = event['grid_state']
-
-            new_aggregate_state = any(reporter_states)
-
-            if new_aggregate_state != current_aggregate_state or event_time == start_date:
-                if event_time > current_time:
-                    duration_seconds = (event_time - current_time).total_seconds()
-
-                    periods.append(PeriodResponse(
-                        start_time       = current_time.isoformat(),
-                        end_time         = event_time.isoformat(),
-                        is_available     = current_aggregate_state,
-                        duration_seconds = int(duration_seconds)
-                    ))
-
-                    if current_aggregate_state:
-                        total_available_seconds += duration_seconds
-                    else:
-                        total_unavailable_seconds += duration_seconds
-
-                current_time = event_time
-                current_aggregate_state = new_aggregate_state
-
-        if current_time < end_date:
-            duration_seconds = (end_date - current_time).total_seconds()
-
-            periods.append(PeriodResponse(
-                start_time       = current_time.isoformat(),
-                end_time         = end_date.isoformat(),
-                is_available     = current_aggregate_state,
-                duration_seconds = int(duration_seconds)
+        result = []
+        for building in buildings:
+            total, days = statistics[building.id]
+            result.append(BuildingOutagesReportResponse(
+                id    = building.id,
+                name  = building.name,
+                total = OutagesStatisticsResponse(**self._process_outage_statistics(total)),
+                days  = [
+                    DailyOutagesStatisticsResponse(day=stats.day, **self._process_outage_statistics(stats))
+                    for stats in days
+                ],
             ))
-
-            if current_aggregate_state:
-                total_available_seconds += duration_seconds
-            else:
-                total_unavailable_seconds += duration_seconds
-
-        total_seconds = int(total_available_seconds + total_unavailable_seconds)
-
-        return PowerLogsResponse(
-            periods                   = periods,
-            total_available_seconds   = int(total_available_seconds),
-            total_unavailable_seconds = int(total_unavailable_seconds),
-            total_generator_seconds   = int(total_generator_seconds),
-            total_seconds             = total_seconds,
-        )
+        return result
@@ -0,0 +1,61 @@
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from fastapi.encoders import jsonable_encoder
+from injector import inject
+
+from app.settings import Settings
+
+
+class SnapshotEntry:
+    __slots__ = ("value", "etag", "built_at", "version")
+
+    def __init__(self, value: Any, version: int):
+        self.value = value
+        self.version = version
+        self.built_at = time.monotonic()
+        content = json.dumps(jsonable_encoder(value), sort_keys=True, separators=(",", ":"))
+        self.etag = f'"{hashlib.sha1(content.encode()).hexdigest()}"'
+
+
+@inject
+class DashboardSnapshot:
+    def __init__(self, settings: Settings):
+        self._ttl = settings.DASHBOARD_SNAPSHOT_TTL
+        self._entries: Dict[str, SnapshotEntry] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._version = 0
+
+    def _is_fresh(self, entry: SnapshotEntry | None) -> bool:
+        return (
+            entry is not None
+            and entry.version == self._version
+            and time.monotonic() - entry.built_at < self._ttl
+        )
+
+    def invalidate(self):
+        self._version += 1
+        self._entries = {}
+
+    async def get(self, key: str, build: Callable[[], Awaitable[Any]]) -> SnapshotEntry:
+        entry = self._entries.get(key)
+        if self._is_fresh(entry):
+            return entry
+
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+
+        async with lock:
+            entry = self._entries.get(key)
+            if self._is_fresh(entry):
+                return entry
+
+            version = self._version
+            entry = SnapshotEntry(await build(), version)
+            if self._ttl > 0 and version == self._version:
+                self._entries[key] = entry
+            return entry
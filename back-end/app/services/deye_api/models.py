@@ -12,6 +12,7 @@ class DeyeConfig:
     email: str
     password: str
     sync_stations_on_poll: bool
+    requests_per_second: float
 
     def __init__(self, settings: Settings):
         self.base_url = settings.DEYE_BASE_URL
@@ -20,10 +21,12 @@ class DeyeConfig:
         self.email = settings.DEYE_EMAIL
         self.password = settings.DEYE_PASSWORD
         self.sync_stations_on_poll = settings.DEYE_SYNC_STATIONS_ON_POLL
+        self.requests_per_second = settings.DEYE_REQUESTS_PER_SECOND
 
     def __str__(self):
         return (
             f"DeyeConfig(base_url='{self.base_url}', app_id='{self.app_id}', "
             f"app_secret='***', email='{self.email}', password='***', "
-            f"sync_stations_on_poll={self.sync_stations_on_poll})"
+            f"sync_stations_on_poll={self.sync_stations_on_poll}, "
+            f"requests_per_second={self.requests_per_second})"
         )
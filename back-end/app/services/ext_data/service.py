@@ -6,6 +6,7 @@ from injector import inject
 from shared.models.ext_data import ExtData
 from shared.models.user import User
 from ..base import BaseService
+from ..availability import AvailabilityService
 from app.models.api import ExtDataItemResponse, ExtDataListRequest, ExtDataListResponse
 from shared.services.events.service import EventsService
 from app.repositories import DataQuery, IExtDataRepository, IUsersRepository
@@ -18,10 +19,12 @@ class ExtDataService(BaseService):
         events: EventsService,
         ext_data: IExtDataRepository,
         users: IUsersRepository,
+        availability: AvailabilityService,
     ):
         super().__init__(events)
         self._ext_data = ext_data
         self._users = users
+        self._availability = availability
 
 
     def _process_ext_data(self, ext_data: ExtData):
@@ -35,6 +38,7 @@ class ExtDataService(BaseService):
 
     async def _add_ext_data(self, user: User, grid_state: bool, date: datetime) -> PydanticObjectId:
         id = await self._ext_data.add_ext_data(user.id, grid_state, date)
+        await self._availability.apply_report(user.id, grid_state, date)
         await self.broadcast_public("ext_data_updated")
         return id
 
@@ -87,7 +91,9 @@ class ExtDataService(BaseService):
 
 
     async def delete_ext_data(self, ext_data_id: PydanticObjectId):
-        if await self._ext_data.delete(ext_data_id):
+        ext_data = await self._ext_data.get_ext_data_by_id(ext_data_id)
+        if ext_data and await self._ext_data.delete(ext_data_id):
+            await self._availability.rebuild_for_user(ext_data.user_id, ext_data.received_at)
             await self.broadcast_public("ext_data_updated")
             return True
         return False
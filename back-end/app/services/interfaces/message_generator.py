@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from shared.models.message import Message
 
+if TYPE_CHECKING:
+    from ..message_generator.context import TemplateResolutionScope
+
 
 @dataclass
 class MessageItem:
@@ -15,11 +19,16 @@ class MessageItem:
 
 class IMessageGeneratorService(ABC):
     
+    @abstractmethod
+    def create_resolution_scope(self) -> "TemplateResolutionScope":
+        ...
+
     @abstractmethod
     async def generate_message(
         self,
         message: Message,
         force = False,
         include_data = False,
+        scope: "TemplateResolutionScope | None" = None,
     ) -> MessageItem | None:
         ...
\ No newline at end of file
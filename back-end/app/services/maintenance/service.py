@@ -1,19 +1,61 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from injector import inject
 
-from app.repositories import IStationsDataRepository, IExtDataRepository
+from app.repositories import IStationsDataRepository, IExtDataRepository, IStationDataRollupsRepository
+from app.settings import Settings
+
+
+logger = logging.getLogger(__name__)
 
 
 @inject
 class MaintenanceService:
     def __init__(
         self,
+        settings: Settings,
         stations_data: IStationsDataRepository,
         ext_data: IExtDataRepository,
+        rollups: IStationDataRollupsRepository,
     ):
+        self._settings = settings
         self._stations_data = stations_data
         self._ext_data = ext_data
+        self._rollups = rollups
 
     
     async def delete_old_data(self, keep_days: int):
         await self._stations_data.delete_old_data(keep_days)
-        await self._ext_data.delete_old_data(keep_days)
\ No newline at end of file
+        await self._ext_data.delete_old_data(keep_days)
+
+    def _get_rollups_timezone(self) -> ZoneInfo:
+        try:
+            return ZoneInfo(self._settings.BOT_TIMEZONE)
+        except ZoneInfoNotFoundError:
+            logger.warning(f'Cannot get timezone {self._settings.BOT_TIMEZONE}, falling back to UTC')
+            return ZoneInfo('UTC')
+
+    async def update_rollups(self, since: datetime):
+        end_date = datetime.now(timezone.utc)
+        tz = self._get_rollups_timezone()
+        tz_name = 'UTC' if tz.key.lower() == 'utc' else tz.key
+
+        # the oldest hour raw data still holds is partly purged; start at the first
+        # complete one so stored rollups are never replaced with partial totals
+        retention_start = (end_date - timedelta(days=self._settings.STATISTIC_KEEP_DAYS)).astimezone(tz)
+        first_full_hour = retention_start.replace(minute=0, second=0, microsecond=0).astimezone(timezone.utc)
+        if first_full_hour < retention_start:
+            first_full_hour += timedelta(hours=1)
+
+        hour_start = since.astimezone(tz).replace(minute=0, second=0, microsecond=0).astimezone(timezone.utc)
+        hour_start = max(hour_start, first_full_hour)
+        max_gap_seconds = self._settings.DEYE_REPORT_INTERVAL * self._settings.DEYE_ASSUMED_OFFLINE_REPORTS
+        await self._rollups.rollup_hours(hour_start, end_date, max_gap_seconds, tz_name)
+
+        day_start = (
+            hour_start.astimezone(tz)
+            .replace(hour=0, minute=0, second=0, microsecond=0)
+            .astimezone(timezone.utc)
+        )
+        await self._rollups.rollup_days(day_start, end_date, tz_name)
@@ -1,6 +1,7 @@
 
+import asyncio
 from collections.abc import Set
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 from injector import Injector
 
@@ -20,16 +21,50 @@ class TemplateRequestCollector:
         return self._requests
 
 
+class TemplateResolutionScope:
+    """Resolves every distinct request once for all messages rendered within the scope."""
+
+    def __init__(self, injector: Injector, concurrency: int):
+        self._injector = injector
+        self._semaphore = asyncio.Semaphore(max(concurrency, 1))
+        self._tasks: Dict[TemplateRequest, asyncio.Future] = {}
+
+    async def _resolve(self, request: TemplateRequest) -> Any:
+        async with self._semaphore:
+            return await request.resolve(self._injector)
+
+    def _get_task(self, request: TemplateRequest) -> asyncio.Future:
+        task = self._tasks.get(request)
+        if task is None or task.cancelled():
+            task = self._tasks[request] = asyncio.ensure_future(self._resolve(request))
+        return task
+
+    async def resolve(self, requests: Iterable[TemplateRequest]) -> Dict[TemplateRequest, Any]:
+        requests = list(requests)
+        while True:
+            # Tasks are shared between messages, so a cancelled caller must not
+            # cancel them; a task cancelled anyway is replaced and awaited again.
+            tasks = [self._get_task(request) for request in requests]
+            values = await asyncio.gather(
+                *(asyncio.shield(task) for task in tasks),
+                return_exceptions=True,
+            )
+            if not any(task.cancelled() for task in tasks):
+                break
+
+        for value in values:
+            if isinstance(value, BaseException):
+                raise value
+        return dict(zip(requests, values))
+
+
 class TemplateRequestResolver:
     async def resolve_requests(
         self,
         collector: TemplateRequestCollector,
-        injector: Injector,
+        scope: TemplateResolutionScope,
     ) -> Dict[TemplateRequest, Any]:
-        results = {}
-        for request in collector.requests:
-            results[request] = await request.resolve(injector)
-        return results
+        return await scope.resolve(collector.requests)
 
 
 class ResolvedValue:
@@ -78,17 +113,19 @@ class ResolvedValue:
 class TemplateRequestContext:
     _collector: TemplateRequestCollector
     _resolver: TemplateRequestResolver
+    _scope: TemplateResolutionScope
     
-    def __init__(self):
+    def __init__(self, scope: TemplateResolutionScope):
         self._collector = TemplateRequestCollector()
         self._resolver = TemplateRequestResolver()
+        self._scope = scope
 
     def add_request(self, request: TemplateRequest) -> TemplateRequest:
         self._collector.add(request)
         return request
 
-    async def resolve_requests(self, injector: Injector):
-        self._resolved = await self._resolver.resolve_requests(self._collector, injector)
+    async def resolve_requests(self):
+        self._resolved = await self._resolver.resolve_requests(self._collector, self._scope)
 
     def get_resolved_value(self, request: TemplateRequest) -> ResolvedValue:
         resolved_request = self._resolved[request]
@@ -10,12 +10,17 @@ from app.settings import Settings
 @inject
 class MessageGeneratorConfig:
     timezone: str
+    resolve_concurrency: int
 
     def __init__(self, settings: Settings):
         self.timezone = settings.BOT_TIMEZONE
+        self.resolve_concurrency = settings.TEMPLATE_RESOLVE_CONCURRENCY
 
     def __str__(self):
-        return (f'MessageGeneratorConfig(timezone={self.timezone})')
+        return (
+            f'MessageGeneratorConfig(timezone={self.timezone}, '
+            f'resolve_concurrency={self.resolve_concurrency})'
+        )
 
 
 @dataclass(frozen=True)
@@ -1,14 +1,15 @@
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import List, Tuple
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from injector import Injector, inject
 
 from shared.models import Message
 from shared.models.station import Station
 from .models import MessageGeneratorConfig
-from .context import TemplateRequestContext
-from app.utils import generate_message, get_send_timeout, get_should_send
+from .context import TemplateRequestContext, TemplateResolutionScope
+from app.utils import generate_message, get_send_timeout, get_should_send, template_cache
+from app.utils.templating import LOOP_ITEMS, MethodCall
 from app.repositories import IMessagesRepository, IStationsDataRepository
 from ..interfaces import IMessageGeneratorService, MessageItem
 from .requests import (
@@ -16,7 +17,7 @@ from .requests import (
     AverageMinutesRequest,
     AverageRequest,
 )
-from .template_method import TemplateMethod, TemplateMethodMode
+from .template_method import TEMPLATE_METHOD_NAMES, TemplateMethod, TemplateMethodMode
 
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ class MessageGeneratorService(IMessageGeneratorService):
         injector: Injector,
     ):
         self._message_timezone = self._try_get_timezone(config.timezone)
+        self._resolve_concurrency = config.resolve_concurrency
         self._messages = messages
         self._stations_data = stations_data
         self._injector = injector
@@ -114,7 +116,42 @@ class MessageGeneratorService(IMessageGeneratorService):
             ).bind(context, mode)
 
 
-    async def generate_message(self, message: Message, force = False, include_data = False) -> MessageItem | None:
+    def _get_receivers(self, template_data, receiver: Tuple) -> List[dict]:
+        value = template_data.get(receiver[0])
+        if len(receiver) > 1:
+            if receiver[1] == LOOP_ITEMS:
+                return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+            try:
+                value = value[receiver[1]]
+            except (IndexError, KeyError, TypeError):
+                return []
+        return [value] if isinstance(value, dict) else []
+
+
+    def _collect_requests(self, template_data, method_calls: Tuple[MethodCall, ...]):
+        for call in method_calls:
+            for station_data in self._get_receivers(template_data, call.receiver):
+                method = station_data.get(call.name)
+                if method is None:
+                    continue
+                try:
+                    method(*call.args, **dict(call.kwargs))
+                except TypeError:
+                    # invalid call sites fail when the template is rendered
+                    continue
+
+
+    def create_resolution_scope(self) -> TemplateResolutionScope:
+        return TemplateResolutionScope(self._injector, self._resolve_concurrency)
+
+
+    async def generate_message(
+        self,
+        message: Message,
+        force = False,
+        include_data = False,
+        scope: TemplateResolutionScope | None = None,
+    ) -> MessageItem | None:
         template_data = {
             'stations': [],
             'now': datetime.now(self._message_timezone),
@@ -133,7 +170,7 @@ class MessageGeneratorService(IMessageGeneratorService):
             logger.info(f"The station for message '{message.name}' is disabled")
             return None
 
-        context = TemplateRequestContext()
+        context = TemplateRequestContext(scope or self.create_resolution_scope())
         self._add_methods(template_data, message.last_sent_time, TemplateMethodMode.Collect, context)
 
         timeout = await get_send_timeout(message.timeout_template, template_data)
@@ -143,8 +180,15 @@ class MessageGeneratorService(IMessageGeneratorService):
             (message.last_sent_time or datetime.min) + timedelta(seconds=timeout)
         ).replace(tzinfo=timezone.utc)
 
-        _ = await generate_message(message.message_template, template_data)
-        await context.resolve_requests(self._injector)
+        method_calls = template_cache.get_method_calls(
+            message.message_template,
+            TEMPLATE_METHOD_NAMES,
+        ) if message.message_template else None
+        if method_calls is None:
+            _ = await generate_message(message.message_template, template_data)
+        else:
+            self._collect_requests(template_data, method_calls)
+        await context.resolve_requests()
         self._add_methods(template_data, message.last_sent_time, TemplateMethodMode.Resolve, context)
         message_content = await generate_message(message.message_template, template_data)
 
@@ -3,6 +3,14 @@ import inspect
 from typing import Any, Callable, Dict
 
 
+TEMPLATE_METHOD_NAMES = frozenset({
+    "get_average",
+    "get_average_all",
+    "get_average_minutes",
+    "get_assumed_state",
+})
+
+
 class TemplateMethodMode(str, Enum):
     Collect = "Collect"
     Resolve = "Resolve"
@@ -1,4 +1,6 @@
+from .models import MessageProcessorConfig, MessageTiming, SendCycleSummary
 from .service import MessageProcessorService
+from .trigger import PeriodicSendTrigger
 
 
-__all__ = [MessageProcessorService]
\ No newline at end of file
+__all__ = [MessageProcessorConfig, MessageProcessorService, MessageTiming, PeriodicSendTrigger, SendCycleSummary]
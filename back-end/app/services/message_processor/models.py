@@ -0,0 +1,58 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List
+
+from injector import inject
+
+from app.settings import Settings
+
+
+@inject
+class MessageProcessorConfig:
+    concurrency: int
+    timeout: int
+
+    def __init__(self, settings: Settings):
+        self.concurrency = max(settings.MESSAGES_SEND_CONCURRENCY, 1)
+        self.timeout = settings.MESSAGES_SEND_TIMEOUT
+
+    def __str__(self):
+        return (f'MessageProcessorConfig(concurrency={self.concurrency}, timeout={self.timeout})')
+
+
+@dataclass
+class MessageTiming:
+    name: str
+    generate_seconds: float = 0.0
+    send_seconds: float = 0.0
+
+    def __str__(self):
+        return f"'{self.name}': generate={self.generate_seconds:.2f}s, send={self.send_seconds:.2f}s"
+
+
+@dataclass
+class SendCycleSummary:
+    evaluated: int = 0
+    sent: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    timings: List[MessageTiming] = field(default_factory=list)
+    next_send_time: datetime | None = None
+
+    def add_next_send_time(self, next_send_time: datetime):
+        if self.next_send_time is None or next_send_time < self.next_send_time:
+            self.next_send_time = next_send_time
+
+    @property
+    def slowest(self) -> MessageTiming | None:
+        return max(
+            self.timings,
+            key=lambda timing: timing.generate_seconds + timing.send_seconds,
+            default=None,
+        )
+
+    def __str__(self):
+        return (
+            f"evaluated={self.evaluated}, sent={self.sent}, failed={self.failed}, "
+            f"timed_out={self.timed_out}, slowest={self.slowest}"
+        )
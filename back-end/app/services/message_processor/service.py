@@ -1,5 +1,7 @@
+import asyncio
 import logging
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from beanie import PydanticObjectId
 from injector import inject
 
@@ -8,6 +10,8 @@ from ..interfaces import IMessageGeneratorService
 from ..telegram import TelegramService
 from shared.services.events.service import EventsService
 from ..base import BaseService
+from ..message_generator.context import TemplateResolutionScope
+from .models import MessageProcessorConfig, MessageTiming, SendCycleSummary
 
 
 logger = logging.getLogger(__name__)
@@ -17,6 +21,7 @@ logger = logging.getLogger(__name__)
 class MessageProcessorService(BaseService):
     def __init__(
         self,
+        config: MessageProcessorConfig,
         events: EventsService,
         message_generator: IMessageGeneratorService,
         telegram: TelegramService,
@@ -25,6 +30,7 @@ class MessageProcessorService(BaseService):
         messages: IMessagesRepository,
     ):
         super().__init__(events)
+        self._config = config
         self._message_generator = message_generator
         self._telegram = telegram
         self._bots = bots
@@ -32,27 +38,89 @@ class MessageProcessorService(BaseService):
         self._messages = messages
 
     
-    async def _send_message(self, message, message_content):
+    async def _send_message(self, message, message_content) -> bool:
         try:
             await self._telegram.send_message(message.bot.id, message.channel_id, message_content)
-            await self._messages.set_last_sent(message.id)
+            await asyncio.shield(self._messages.set_last_sent(message.id))
             message.last_sent_time = datetime.now(timezone.utc)
+            return True
         except Exception as e:
             logger.error(f"Error sending message: {e}")
+            return False
 
 
-    async def periodic_send(self):
-        messages = await self._messages.get_messages()
+    async def _process_message(
+        self,
+        message,
+        scope: TemplateResolutionScope,
+        summary: SendCycleSummary,
+        timing: MessageTiming,
+    ):
+        # Only generation is bounded: once a send has started it runs to the end,
+        # so a message is never cancelled between sending and recording last_sent.
+        started_at = time.monotonic()
+        info = await asyncio.wait_for(
+            self._message_generator.generate_message(message, scope=scope),
+            timeout=self._config.timeout,
+        )
+        timing.generate_seconds = time.monotonic() - started_at
+        summary.evaluated += 1
+
+        if info is None or not info.should_send:
+            return
+        if info.next_send_time > datetime.now(timezone.utc):
+            summary.add_next_send_time(info.next_send_time)
+            return
 
-        for message in messages:
+        started_at = time.monotonic()
+        sent = await self._send_message(message, info.message)
+        timing.send_seconds = time.monotonic() - started_at
+        if sent:
+            summary.sent += 1
+            summary.add_next_send_time(message.last_sent_time + timedelta(seconds=info.timeout))
+        else:
+            summary.failed += 1
+
+
+    async def _run_message(
+        self,
+        message,
+        scope: TemplateResolutionScope,
+        semaphore: asyncio.Semaphore,
+        summary: SendCycleSummary,
+    ):
+        async with semaphore:
+            timing = MessageTiming(message.name)
+            summary.timings.append(timing)
             try:
-                info = await self._message_generator.generate_message(message)
-                if info is None:
-                    continue
-                if info.should_send and info.next_send_time <= datetime.now(timezone.utc):
-                    await self._send_message(message, info.message)
+                await self._process_message(message, scope, summary, timing)
+            except asyncio.TimeoutError:
+                logger.warning(f"Timed out generating message '{message.name}'")
+                summary.timed_out += 1
+            except asyncio.CancelledError:
+                if asyncio.current_task().cancelling():
+                    raise
+                logger.error(f"Processing of message '{message.name}' was cancelled")
+                summary.failed += 1
             except Exception as e:
                 logger.error(f"Error sending message '{message.name}': {e}")
+                summary.failed += 1
+
+
+    async def periodic_send(self) -> SendCycleSummary:
+        messages = await self._messages.get_messages()
+        scope = self._message_generator.create_resolution_scope()
+        semaphore = asyncio.Semaphore(self._config.concurrency)
+        summary = SendCycleSummary()
+
+        await asyncio.gather(
+            *(self._run_message(message, scope, semaphore, summary) for message in messages)
+        )
+
+        logger.info(f"Messages send cycle finished: {summary}")
+        for timing in summary.timings:
+            logger.debug(f"Message {timing}")
+        return summary
 
 
     async def handle_incoming_message(self, bot_id: PydanticObjectId, message):
@@ -66,5 +134,5 @@ class MessageProcessorService(BaseService):
                 await self._telegram.send_message(bot_id, chat_id, f"pong '{text}'")
             else:
                 await self._chats.add_chat_request(chat_id, bot_id)
-                self.broadcast_private("chats_updated")
+                await self.broadcast_private("chats_updated")
                 logger.warning(f'request from not allowed chat {chat_id}')
@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, EVENT_JOB_SUBMITTED, JobEvent
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from injector import inject
+
+
+@inject
+class PeriodicSendTrigger:
+    """Moves the periodic send job forward; running through the same job keeps max_instances in effect.
+
+    A run requested while the job is running would be skipped by max_instances,
+    so the earliest such request is kept and applied once the instance has finished.
+    """
+    JOB_ID = 'periodic_send_message'
+    JOB_EVENTS = EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR
+
+    def __init__(self, scheduler: AsyncIOScheduler):
+        self._scheduler = scheduler
+        self._running = False
+        self._pending_time: datetime | None = None
+
+    def _move_next_run(self, run_time: datetime):
+        # a next_run_time already in the past would be dropped as a misfire
+        run_time = max(run_time, datetime.now(timezone.utc))
+        job = self._scheduler.get_job(self.JOB_ID)
+        if job is not None and (job.next_run_time is None or run_time < job.next_run_time):
+            job.modify(next_run_time=run_time)
+
+    def request(self, run_time: datetime | None = None):
+        run_time = run_time or datetime.now(timezone.utc)
+        if self._running:
+            if self._pending_time is None or run_time < self._pending_time:
+                self._pending_time = run_time
+            return
+        self._move_next_run(run_time)
+
+    def handle_job_event(self, event: JobEvent):
+        if event.job_id != self.JOB_ID:
+            return
+        if event.code == EVENT_JOB_SUBMITTED:
+            self._running = True
+            return
+
+        # executors dispatch these once the instance count is released
+        self._running = False
+        run_time, self._pending_time = self._pending_time, None
+        if run_time is not None:
+            self._move_next_run(run_time)
@@ -1,3 +1,4 @@
 from .service import StationsService
+from .models import StationsSyncConfig, SyncCycleSummary
 
-__all__ = [StationsService]
\ No newline at end of file
+__all__ = [StationsService, StationsSyncConfig, SyncCycleSummary]
@@ -0,0 +1,62 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import List
+
+from bson import ObjectId
+
+from app.models import ExportFormat
+
+
+EXPORT_COLUMNS = {
+    "id": "_id",
+    "stationId": "station_id",
+    "batteryPower": "battery_power",
+    "batterySoc": "battery_soc",
+    "chargePower": "charge_power",
+    "code": "code",
+    "consumptionPower": "consumption_power",
+    "dischargePower": "discharge_power",
+    "generationPower": "generation_power",
+    "gridPower": "grid_power",
+    "irradiateIntensity": "irradiate_intensity",
+    "lastUpdateTime": "last_update_time",
+    "msg": "msg",
+    "purchasePower": "purchase_power",
+    "requestId": "request_id",
+    "wirePower": "wire_power",
+}
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _serialize_value(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=timezone.utc).isoformat()
+    return value
+
+
+def _to_row(document: dict) -> dict:
+    return {
+        name: _serialize_value(document.get(field))
+        for name, field in EXPORT_COLUMNS.items()
+    }
+
+
+def format_ndjson(documents: List[dict]) -> str:
+    return "".join(json.dumps(_to_row(document)) + "\n" for document in documents)
+
+
+def format_csv(documents: List[dict], header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(EXPORT_COLUMNS))
+    if header:
+        writer.writeheader()
+    writer.writerows(_to_row(document) for document in documents)
+    return buffer.getvalue()
@@ -0,0 +1,51 @@
+import math
+from dataclasses import dataclass, field
+from typing import List
+
+from injector import inject
+
+from app.settings import Settings
+
+
+@inject
+class StationsSyncConfig:
+    concurrency: int
+    timeout: int
+
+    def __init__(self, settings: Settings):
+        self.concurrency = max(settings.DEYE_FETCH_CONCURRENCY, 1)
+        self.timeout = settings.DEYE_FETCH_TIMEOUT
+
+    def __str__(self):
+        return (f'StationsSyncConfig(concurrency={self.concurrency}, timeout={self.timeout})')
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+@dataclass
+class SyncCycleSummary:
+    fetched: int = 0
+    stored: int = 0
+    skipped: int = 0
+    failed: int = 0
+    latencies: List[float] = field(default_factory=list)
+
+    @property
+    def p50(self) -> float:
+        return _percentile(self.latencies, 50)
+
+    @property
+    def p95(self) -> float:
+        return _percentile(self.latencies, 95)
+
+    def __str__(self):
+        return (
+            f"fetched={self.fetched}, stored={self.stored}, skipped={self.skipped}, failed={self.failed}, "
+            f"p50={self.p50:.2f}s, p95={self.p95:.2f}s"
+        )
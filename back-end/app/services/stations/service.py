@@ -1,13 +1,24 @@
 import asyncio
-from datetime import datetime
-from typing import List
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List
+from beanie import PydanticObjectId
 from injector import inject
 
-from app.repositories import IStationsRepository, IStationsDataRepository
-from shared.models import Station, StationData
+from app.models import DownsamplingMode, ExportFormat
+from app.models.deye import DeyeStationData
+from app.repositories import IStationsRepository, IStationsDataRepository, IStationDataRollupsRepository
+from app.settings import Settings
+from shared.models import Station, StationData, StationDataRollup
 from shared.services.events.service import EventsService
 from ..base import BaseService
 from ..deye_api import DeyeApiService
+from .export import format_csv, format_ndjson
+from .models import StationsSyncConfig, SyncCycleSummary
+
+
+logger = logging.getLogger(__name__)
 
 
 @inject
@@ -15,14 +26,20 @@ class StationsService(BaseService):
     def __init__(
         self,
         events: EventsService,
+        settings: Settings,
+        config: StationsSyncConfig,
         deye_api: DeyeApiService,
         stations: IStationsRepository,
         stations_data: IStationsDataRepository,
+        rollups: IStationDataRollupsRepository,
     ):
         super().__init__(events)
+        self._settings = settings
+        self._config = config
         self._deye_api = deye_api
         self._stations = stations
         self._stations_data = stations_data
+        self._rollups = rollups
 
     async def get_stations(self):
         return await self._stations.get_stations(all=True)
@@ -31,10 +48,6 @@ class StationsService(BaseService):
         station_data = await self._stations_data.get_full_station_data(station.id, last_seconds)
         return station, station_data
 
-    async def _get_station_data_range(self, station: Station, start_date: datetime, end_date: datetime):
-        station_data = await self._stations_data.get_full_station_data_range(station.id, start_date, end_date)
-        return station, station_data
-
     async def get_station_data(self, station_id: str, last_seconds: int) -> tuple[Station, List[StationData]]:
         station = await self._stations.get_station(station_id)
         if not station:
@@ -42,24 +55,82 @@ class StationsService(BaseService):
 
         return await self._get_station_data(station, last_seconds)
 
-    async def get_stations_data(self, last_seconds: int) -> List[tuple[Station, List[StationData]]]:
-        stations = await self._stations.get_stations()
-        tasks = [
-            asyncio.create_task(self._get_station_data(station, last_seconds))
-            for station in stations
-        ]
+    async def _get_station_chart_data(
+        self,
+        station: Station,
+        start_date: datetime,
+        end_date: datetime,
+        records_count: int | None,
+        mode: DownsamplingMode,
+    ):
+        station_data = await self._stations_data.get_chart_station_data(
+            station.id,
+            start_date,
+            end_date,
+            records_count,
+            mode,
+        )
+        return station, station_data
 
-        return await asyncio.gather(*tasks)
+    async def get_stations_chart_data(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        last_seconds: int | None,
+        records_count: int | None,
+        mode: DownsamplingMode = DownsamplingMode.AVERAGE,
+    ) -> List[tuple[Station, List[dict]]]:
+        if start_date is None or end_date is None:
+            end_date = datetime.now(timezone.utc)
+            start_date = end_date - timedelta(seconds=last_seconds)
 
-    async def get_stations_data_range(self, start_date: datetime, end_date: datetime) -> List[tuple[Station, List[StationData]]]:
         stations = await self._stations.get_stations()
         tasks = [
-            asyncio.create_task(self._get_station_data_range(station, start_date, end_date))
+            asyncio.create_task(
+                self._get_station_chart_data(station, start_date, end_date, records_count, mode)
+            )
             for station in stations
         ]
 
         return await asyncio.gather(*tasks)
 
+    async def export_stations_data(
+        self,
+        station_ids: List[PydanticObjectId] | None,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        last_seconds: int | None,
+        format: ExportFormat = ExportFormat.NDJSON,
+    ) -> AsyncIterator[str]:
+        if start_date is None or end_date is None:
+            end_date = datetime.now(timezone.utc)
+            start_date = end_date - timedelta(seconds=last_seconds)
+
+        header = True
+        async for documents in self._stations_data.iter_station_data_batches(
+            station_ids,
+            start_date,
+            end_date,
+            max(self._settings.STATISTIC_EXPORT_BATCH_SIZE, 1),
+        ):
+            if format == ExportFormat.CSV:
+                yield format_csv(documents, header)
+                header = False
+            else:
+                yield format_ndjson(documents)
+
+        if header and format == ExportFormat.CSV:
+            yield format_csv([], header)
+
+    async def get_rollups(
+        self,
+        station_ids: List[PydanticObjectId] | None,
+        period: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[StationDataRollup]:
+        return await self._rollups.get_rollups(station_ids, period, start_date, end_date)
+
     async def edit_station(
         self,
         station_id: str,
@@ -81,13 +152,56 @@ class StationsService(BaseService):
         for station in stations.station_list:
             await self._stations.add_station(station)
 
-    async def sync_stations_data(self):
+    async def _sync_station_data(
+        self,
+        station: Station,
+        semaphore: asyncio.Semaphore,
+        summary: SyncCycleSummary,
+    ) -> DeyeStationData | None:
+        async with semaphore:
+            # Waiting for the rate limiter is not part of the request: it is kept
+            # out of both the timeout and the reported latency.
+            await self._deye_api.acquire()
+            started_at = time.monotonic()
+            try:
+                station_data = await asyncio.wait_for(
+                    self._deye_api.get_station_data(station.station_id, rate_limited=False),
+                    timeout=self._config.timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Timed out fetching data for station {station.station_id}")
+                summary.failed += 1
+                return None
+            except Exception:
+                logger.error(f"Error fetching data for station {station.station_id}", exc_info=True)
+                summary.failed += 1
+                return None
+            finally:
+                summary.latencies.append(time.monotonic() - started_at)
+
+        if station_data is None:
+            summary.skipped += 1
+            return None
+
+        summary.fetched += 1
+        return station_data
+
+    async def sync_stations_data(self) -> SyncCycleSummary:
         stations = await self._stations.get_stations()
+        semaphore = asyncio.Semaphore(self._config.concurrency)
+        summary = SyncCycleSummary()
 
-        for station in stations:
-            station_data = await self._deye_api.get_station_data(station.station_id)
-            if station_data is None:
-                continue
+        results = await asyncio.gather(
+            *(self._sync_station_data(station, semaphore, summary) for station in stations)
+        )
+        batch = [
+            (station, station_data)
+            for station, station_data in zip(stations, results)
+            if station_data is not None
+        ]
+        if batch:
+            summary.stored = await self._stations_data.add_stations_data(batch)
 
-            await self._stations_data.add_station_data(station, station_data)
+        logger.info(f"Stations data sync finished: {summary}")
         await self.broadcast_public("station_data_updated")
+        return summary
@@ -31,6 +31,9 @@ class Settings(BaseSettings, BaseAppSettings, BaseJWTSettings, BaseMongoSettings
     DEYE_PASSWORD: str | None = None
 
     DEYE_FETCH_INTERVAL: int = Field(default=120)
+    DEYE_FETCH_CONCURRENCY: int = Field(default=8)
+    DEYE_FETCH_TIMEOUT: int = Field(default=20)
+    DEYE_REQUESTS_PER_SECOND: float = Field(default=5.0)
     DEYE_SYNC_STATIONS_ON_POLL: bool = Field(default=False)
 
     DEYE_REPORT_INTERVAL: int = Field(default=300)
@@ -42,6 +45,10 @@ class Settings(BaseSettings, BaseAppSettings, BaseJWTSettings, BaseMongoSettings
     TG_HOOK_BASE_URL: str | None = None
 
     BOT_TIMEZONE: str = "utc"
+    TEMPLATE_RESOLVE_CONCURRENCY: int = 8
+    MESSAGES_SEND_INTERVAL: int = 300
+    MESSAGES_SEND_CONCURRENCY: int = 4
+    MESSAGES_SEND_TIMEOUT: int = 30
 
     # -------------------------
     # Auth / Admin
@@ -54,7 +61,14 @@ class Settings(BaseSettings, BaseAppSettings, BaseJWTSettings, BaseMongoSettings
     # -------------------------
     HOST: str = "127.0.0.1"
     STATISTIC_KEEP_DAYS: int = 3
+    STATISTIC_AGGREGATES_HOURS: int = 24
+    STATISTIC_STORE_HOURS: int = 0
+    STATISTIC_ROLLUP_LOOKBACK_HOURS: int = 3
+    STATISTIC_EXPORT_BATCH_SIZE: int = 1000
     SSE_PING_INTERVAL: int = 45
+    DASHBOARD_SNAPSHOT_TTL: int = 10
+    AVAILABILITY_STRATEGY: str = "any"
+    AVAILABILITY_QUORUM: float = 0.5
 
 
 class ProductionSettings(Settings):
@@ -1,5 +1,8 @@
-from .templating import generate_message, get_send_timeout, get_should_send
+from .templating import generate_message, get_send_timeout, get_should_send, template_cache
 from .power_estimation import get_estimate_discharge_time, get_estimate_charge_time, get_kilowatthour_consumption
+from .rate_limiter import TokenBucket
+from .downsampling import average_buckets, largest_triangle_three_buckets
 
-__all__ = [generate_message, get_kilowatthour_consumption,
-           get_send_timeout, get_should_send, get_estimate_discharge_time, get_estimate_charge_time]
\ No newline at end of file
+__all__ = [generate_message, get_kilowatthour_consumption, template_cache,
+           get_send_timeout, get_should_send, get_estimate_discharge_time, get_estimate_charge_time,
+           TokenBucket, average_buckets, largest_triangle_three_buckets]
\ No newline at end of file
@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+from typing import List, Sequence
+
+
+def _mean(values: Sequence[float]) -> float:
+    return sum(values) / len(values)
+
+
+def largest_triangle_three_buckets(
+    rows: List[dict],
+    threshold: int,
+    columns: Sequence[str],
+    time_key: str = "last_update_time",
+) -> List[dict]:
+    count = len(rows)
+    if not threshold or threshold >= count or threshold < 3:
+        return rows
+
+    x = [row[time_key].replace(tzinfo=timezone.utc).timestamp() for row in rows]
+    series = [[float(row[column] or 0) for row in rows] for column in columns]
+    scales = []
+    for values in series:
+        spread = max(values) - min(values)
+        scales.append(1 / spread if spread else 1.0)
+
+    sampled = [rows[0]]
+    every = (count - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, count)
+        avg_x = _mean(x[avg_start:avg_end])
+        avg_ys = [_mean(values[avg_start:avg_end]) for values in series]
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+
+        best_area = -1.0
+        best_index = range_start
+        for j in range(range_start, range_end):
+            area = 0.0
+            for values, avg_y, scale in zip(series, avg_ys, scales):
+                area += abs(
+                    (x[a] - avg_x) * (values[j] - values[a])
+                    - (x[a] - x[j]) * (avg_y - values[a])
+                ) * scale
+            if area > best_area:
+                best_area = area
+                best_index = j
+
+        sampled.append(rows[best_index])
+        a = best_index
+
+    sampled.append(rows[-1])
+    return sampled
+
+
+def average_buckets(
+    rows: List[dict],
+    buckets: int,
+    columns: Sequence[str],
+    time_key: str = "last_update_time",
+) -> List[dict]:
+    count = len(rows)
+    if not buckets or buckets >= count:
+        return rows
+
+    result = []
+    for i in range(buckets):
+        chunk = rows[i * count // buckets:(i + 1) * count // buckets]
+        if not chunk:
+            continue
+
+        timestamp = _mean([row[time_key].replace(tzinfo=timezone.utc).timestamp() for row in chunk])
+        result.append({
+            **{column: _mean([row[column] or 0 for row in chunk]) for column in columns},
+            time_key: datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None),
+        })
+    return result
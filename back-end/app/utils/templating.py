@@ -1,14 +1,244 @@
-from jinja2 import Environment
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, NamedTuple, Set, Tuple
 
+from jinja2 import Environment, Template, nodes
 
-def _create_template(template: str):
-    environment = Environment(
-        lstrip_blocks = True,
-        trim_blocks = True,
-        enable_async = True,
-    )
-    return environment.from_string(template)
 
+TEMPLATE_CACHE_SIZE = 256
+
+
+LOOP_ITEMS = "*"
+
+
+class MethodCall(NamedTuple):
+    name: str
+    receiver: Tuple[Any, ...]
+    args: Tuple[Any, ...]
+    kwargs: Tuple[Tuple[str, Any], ...]
+
+
+def _get_method_name(node: nodes.Node, method_names: FrozenSet[str]) -> str | None:
+    if isinstance(node, nodes.Getattr) and node.attr in method_names:
+        return node.attr
+    if (
+        isinstance(node, nodes.Getitem)
+        and isinstance(node.arg, nodes.Const)
+        and node.arg.value in method_names
+    ):
+        return node.arg.value
+    return None
+
+
+def _get_bound_names(tree: nodes.Template) -> Set[str]:
+    names = set()
+    for node in tree.find_all((nodes.Assign, nodes.AssignBlock, nodes.With, nodes.Macro, nodes.CallBlock)):
+        targets = node.targets if isinstance(node, nodes.With) else (
+            node.args if isinstance(node, (nodes.Macro, nodes.CallBlock)) else [node.target]
+        )
+        for target in targets:
+            names.update(name.name for name in target.find_all(nodes.Name))
+            if isinstance(target, nodes.Name):
+                names.add(target.name)
+    return names
+
+
+class _MethodCallFinder:
+    """Walks the template and records the receiver of every method call.
+
+    A receiver is a template variable, a constant index into one, or a loop
+    variable over one (LOOP_ITEMS). Loop variables used inside a condition or
+    a filtered loop have no receiver: the call may run for only some items.
+    """
+
+    def __init__(self, method_names: FrozenSet[str], bound_names: Set[str]):
+        self.method_names = method_names
+        self.bound_names = bound_names
+        self.calls = []
+        self.callees = set()
+        self.complete = True
+
+    def _get_receiver(self, node: nodes.Node, loops: Dict[str, Tuple[Any, ...] | None]) -> Tuple[Any, ...] | None:
+        if isinstance(node, nodes.Name):
+            if node.name in loops:
+                return loops[node.name]
+            return None if node.name in self.bound_names else (node.name,)
+        if (
+            isinstance(node, nodes.Getitem)
+            and isinstance(node.node, nodes.Name)
+            and isinstance(node.arg, nodes.Const)
+            and node.node.name not in loops
+            and node.node.name not in self.bound_names
+        ):
+            return node.node.name, node.arg.value
+        return None
+
+    def _visit_call(self, call: nodes.Call, loops: Dict[str, Tuple[Any, ...] | None]):
+        name = _get_method_name(call.node, self.method_names)
+        if name is None:
+            return
+        self.callees.add(id(call.node))
+
+        receiver = self._get_receiver(call.node.node, loops)
+        if (
+            receiver is None
+            or call.dyn_args is not None
+            or call.dyn_kwargs is not None
+            or not all(isinstance(arg, nodes.Const) for arg in call.args)
+            or not all(isinstance(kwarg.value, nodes.Const) for kwarg in call.kwargs)
+        ):
+            self.complete = False
+            return
+
+        self.calls.append(MethodCall(
+            name     = name,
+            receiver = receiver,
+            args     = tuple(arg.value for arg in call.args),
+            kwargs   = tuple((kwarg.key, kwarg.value.value) for kwarg in call.kwargs),
+        ))
+
+    def _visit_for(self, node: nodes.For, loops: Dict[str, Tuple[Any, ...] | None]):
+        self.visit(node.iter, loops)
+
+        receiver = None
+        if (
+            node.test is None
+            and not node.recursive
+            and isinstance(node.target, nodes.Name)
+            and isinstance(node.iter, nodes.Name)
+            and node.iter.name not in loops
+            and node.iter.name not in self.bound_names
+        ):
+            receiver = (node.iter.name, LOOP_ITEMS)
+
+        inner = {**loops, **{name.name: None for name in node.target.find_all(nodes.Name)}}
+        if isinstance(node.target, nodes.Name):
+            inner[node.target.name] = receiver
+        if node.test is not None:
+            self.visit(node.test, inner)
+        for child in node.body:
+            self.visit(child, inner)
+        for child in node.else_:
+            self.visit(child, loops)
+
+    def visit(self, node: nodes.Node, loops: Dict[str, Tuple[Any, ...] | None]):
+        if isinstance(node, nodes.For):
+            self._visit_for(node, loops)
+            return
+
+        conditional = {name: None for name in loops}
+        if isinstance(node, nodes.If):
+            self.visit(node.test, loops)
+            for child in [*node.body, *node.elif_, *node.else_]:
+                self.visit(child, conditional)
+            return
+        if isinstance(node, nodes.CondExpr):
+            self.visit(node.test, loops)
+            self.visit(node.expr1, conditional)
+            if node.expr2 is not None:
+                self.visit(node.expr2, conditional)
+            return
+        if isinstance(node, (nodes.And, nodes.Or)):
+            self.visit(node.left, loops)
+            self.visit(node.right, conditional)
+            return
+
+        if isinstance(node, nodes.Call):
+            self._visit_call(node, loops)
+        for child in node.iter_child_nodes():
+            self.visit(child, loops)
+
+
+def find_method_calls(
+    environment: Environment,
+    source: str,
+    method_names: FrozenSet[str],
+) -> Tuple[MethodCall, ...] | None:
+    """Returns every call of the given methods, bound to its receiver, when all of them can be known statically.
+
+    None means the calls cannot be known without rendering: a method is called
+    with a non-constant argument, on a receiver that is not a plain variable,
+    constant index or unconditional loop variable, or referenced without being called.
+    """
+    tree = environment.parse(source)
+    finder = _MethodCallFinder(method_names, _get_bound_names(tree))
+    finder.visit(tree, {})
+    if not finder.complete:
+        return None
+
+    for node in tree.find_all((nodes.Getattr, nodes.Getitem)):
+        if _get_method_name(node, method_names) and id(node) not in finder.callees:
+            return None
+
+    return tuple(dict.fromkeys(finder.calls))
+
+
+class CompiledTemplate:
+    __slots__ = ("template", "method_calls")
+
+    def __init__(self, template: Template):
+        self.template = template
+        self.method_calls: Dict[FrozenSet[str], Tuple[MethodCall, ...] | None] = {}
+
+
+class TemplateCache:
+    def __init__(self, environment: Environment, max_size: int):
+        self._environment = environment
+        self._max_size = max_size
+        self._templates: OrderedDict[str, CompiledTemplate] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_compiled(self, source: str, count: bool = True) -> CompiledTemplate:
+        key = hashlib.sha1(source.encode()).hexdigest()
+        compiled = self._templates.get(key)
+        if compiled is not None:
+            self._templates.move_to_end(key)
+            if count:
+                self.hits += 1
+            return compiled
+
+        if count:
+            self.misses += 1
+        compiled = CompiledTemplate(self._environment.from_string(source))
+        self._templates[key] = compiled
+        if len(self._templates) > self._max_size:
+            self._templates.popitem(last=False)
+        return compiled
+
+    def get(self, source: str) -> Template:
+        return self._get_compiled(source).template
+
+    def get_method_calls(self, source: str, method_names: FrozenSet[str]) -> Tuple[MethodCall, ...] | None:
+        # Lookups for AST metadata are not counted, so hits/misses track renders only.
+        compiled = self._get_compiled(source, count=False)
+        if method_names not in compiled.method_calls:
+            compiled.method_calls[method_names] = find_method_calls(self._environment, source, method_names)
+        return compiled.method_calls[method_names]
+
+    def clear(self):
+        self._templates.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            "size": len(self._templates),
+            "maxSize": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_environment = Environment(
+    lstrip_blocks = True,
+    trim_blocks = True,
+    enable_async = True,
+)
+
+template_cache = TemplateCache(_environment, TEMPLATE_CACHE_SIZE)
+
+
+def _create_template(template: str):
+    return template_cache.get(template)
 
 async def generate_message(template_str: str, data: dict):
     try:
@@ -1,6 +1,7 @@
 from .lookup import LookupValue, BeanieFilter
 from .localizable_value import LocalizableValue
 from .allowed_chat import AllowedChat
+from .availability_period import AvailabilityPeriod
 from .chat_request import ChatRequest
 from .bot import Bot
 from .building import Building
@@ -9,20 +10,21 @@ from .ext_data import ExtData
 from .message import Message
 from .station import Station
 from .station_data import StationData
+from .station_data_rollup import StationDataRollup
 from .user import User
 from .visit_counter import VisitCounter, DailyVisitCounter
 from .beanie_filter import BeanieFilter
 
 
 __all__ = [
-    BeanieFilter, Bot, AllowedChat, ChatRequest,
+    BeanieFilter, Bot, AllowedChat, AvailabilityPeriod, ChatRequest,
     User, Message, Station, Building,
-    StationData, ExtData, DashboardConfig,
+    StationData, StationDataRollup, ExtData, DashboardConfig,
     VisitCounter, DailyVisitCounter, LookupValue,
     LocalizableValue,
 ]
 
-BEANIE_MODELS = [Bot, AllowedChat, ChatRequest,
+BEANIE_MODELS = [Bot, AllowedChat, AvailabilityPeriod, ChatRequest,
     User, Message, Station, Building,
-    StationData, ExtData, DashboardConfig,
+    StationData, StationDataRollup, ExtData, DashboardConfig,
     VisitCounter, DailyVisitCounter]
\ No newline at end of file
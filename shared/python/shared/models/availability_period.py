@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Dict, Optional
+
+from beanie import Document
+from beanie.odm.fields import PydanticObjectId
+from pymongo import ASCENDING, IndexModel
+
+
+class AvailabilityPeriod(Document):
+    building_id: PydanticObjectId
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    is_available: bool
+
+    available_seconds_before: float = 0.0
+    unavailable_seconds_before: float = 0.0
+
+    reporter_states: Dict[str, bool] = {}
+    available_weight: Optional[float] = None
+    last_event_time: Optional[datetime] = None
+    strategy: Optional[str] = None
+
+    class Settings:
+        name = "availability_periods"
+        indexes = [
+            IndexModel([("building_id", ASCENDING), ("start_time", ASCENDING)], unique=True),
+            IndexModel([("building_id", ASCENDING), ("end_time", ASCENDING)]),
+        ]
+
+    def __str__(self):
+        return (
+            f"AvailabilityPeriod(building_id={self.building_id}, start_time={self.start_time}, "
+            f"end_time={self.end_time}, is_available={self.is_available})"
+        )
@@ -1,6 +1,7 @@
 from beanie import Document
 from beanie.odm.fields import PydanticObjectId
 from datetime import datetime, timezone
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from .user import User
 
@@ -17,6 +18,9 @@ class ExtData(Document):
             "meta_field": "user_id",
             "granularity": "minutes",
         }
+        indexes = [
+            IndexModel([("user_id", ASCENDING), ("received_at", DESCENDING)]),
+        ]
 
     @property
     async def user(self) -> User:
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Literal, Optional
+
+from beanie import Document
+from beanie.odm.fields import PydanticObjectId
+from pymongo import ASCENDING, IndexModel
+
+
+class StationDataRollup(Document):
+    station_id: PydanticObjectId
+    period: Literal["hour", "day"]
+    start_time: datetime
+
+    samples_count: int = 0
+
+    battery_soc_min: Optional[float] = None
+    battery_soc_avg: Optional[float] = None
+    battery_soc_max: Optional[float] = None
+
+    consumption_kwh: float = 0.0
+    generation_kwh: float = 0.0
+
+    grid_seconds: float = 0.0
+    generator_seconds: float = 0.0
+    battery_seconds: float = 0.0
+
+    class Settings:
+        name = "station_data_rollups"
+        indexes = [
+            IndexModel(
+                [("station_id", ASCENDING), ("period", ASCENDING), ("start_time", ASCENDING)],
+                unique=True,
+            ),
+        ]
+
+    def to_dict(self):
+        return {
+            "station_id": str(self.station_id),
+            "period": self.period,
+            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "samples_count": self.samples_count,
+            "battery_soc_min": self.battery_soc_min,
+            "battery_soc_avg": self.battery_soc_avg,
+            "battery_soc_max": self.battery_soc_max,
+            "consumption_kwh": self.consumption_kwh,
+            "generation_kwh": self.generation_kwh,
+            "grid_seconds": self.grid_seconds,
+            "generator_seconds": self.generator_seconds,
+            "battery_seconds": self.battery_seconds,
+        }
@@ -1,5 +1,6 @@
-from typing import Set
+from typing import Awaitable, Callable, Dict, List, Set
 import asyncio
+import logging
 
 from .models import EventItem, EventsServiceConfig
 from .events_transport import EventsTransport, LocalTransport
@@ -7,6 +8,12 @@ from .redis_transport import RedisTransport
 from ...bounded_queue import BoundedQueue
 
 
+logger = logging.getLogger(__name__)
+
+
+EventHandler = Callable[[EventItem], Awaitable[None]]
+
+
 class EventsService:
     REDIS_PUBLIC_CHANNEL = "sse_public"
     REDIS_PRIVATE_CHANNEL = "sse_private"
@@ -24,6 +31,8 @@ class EventsService:
         self._public_clients: Set[BoundedQueue] = set()
         self._private_clients: Set[BoundedQueue] = set()
         self._subscriber_task: asyncio.Task | None = None
+        self._handlers: Dict[str, List[EventHandler]] = {}
+        self._handler_tasks: Set[asyncio.Task] = set()
 
     async def start(self):
         if self._subscriber_task:
@@ -58,6 +67,21 @@ class EventsService:
         self._public_clients.discard(q)
         self._private_clients.discard(q)
 
+    def subscribe(self, type: str, handler: EventHandler):
+        self._handlers.setdefault(type, []).append(handler)
+
+    async def _run_handler(self, handler: EventHandler, event: EventItem):
+        try:
+            await handler(event)
+        except Exception:
+            logger.error(f"Error handling '{event.type}' event", exc_info=True)
+
+    def _dispatch_to_handlers(self, event: EventItem):
+        for handler in self._handlers.get(event.type, []):
+            task = asyncio.create_task(self._run_handler(handler, event))
+            self._handler_tasks.add(task)
+            task.add_done_callback(self._handler_tasks.discard)
+
     async def broadcast_public(self, type: str, data: dict = None):
         evt = EventItem(type, data, False)
         await self.transport.publish(self.REDIS_PUBLIC_CHANNEL, evt)
@@ -79,6 +103,8 @@ class EventsService:
 
 
     async def _handle_incoming_event(self, channel: str, event: EventItem):
+        self._dispatch_to_handlers(event)
+
         if channel == self.REDIS_PUBLIC_CHANNEL:
             await self._broadcast_to_local(self._public_clients, event)
         elif channel == self.REDIS_PRIVATE_CHANNEL: